@@ -0,0 +1,7 @@
+"""Entry point: `python -m src` (see `src/cli.py`)."""
+
+import sys
+
+from src.cli import main
+
+sys.exit(main())
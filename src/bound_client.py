@@ -0,0 +1,67 @@
+"""
+bound_client.py — stdlib-only client for `bound_server`
+
+Importing this module does not import numpy or scipy, so short-lived
+tools pay only the Python startup cost:
+
+    from src.bound_client import BoundClient
+    c = BoundClient(port=8765)
+    c.query("t_star", gamma=[0.1, 1.0])["values"]
+    c.batch([{"quantity": "delta_t_min", "args": {"phi": 1e3, "alpha": 0.6}}])
+    c.stats()
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+from typing import Any, Dict, List, Optional
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class BoundClient:
+    """Keep-alive HTTP client for a running bound server."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None, timeout: float = 10.0):
+        if unix_path:
+            self.conn = _UnixHTTPConnection(unix_path, timeout)
+        else:
+            self.conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None) -> Any:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        self.conn.request(method, path, body=body, headers=headers)
+        resp = self.conn.getresponse()
+        data = json.loads(resp.read())
+        if resp.status != 200:
+            raise ValueError(data.get("error", f"HTTP {resp.status}"))
+        return data
+
+    def query(self, quantity: str, **args) -> Dict[str, Any]:
+        """One quantity on (broadcast) argument lists."""
+        return self._request("POST", "/query", {"quantity": quantity, "args": args})
+
+    def batch(self, queries: List[dict]) -> List[Dict[str, Any]]:
+        """Several queries in one round trip."""
+        return self._request("POST", "/query", {"queries": queries})["results"]
+
+    def quantities(self) -> Dict[str, Any]:
+        return self._request("GET", "/quantities")
+
+    def stats(self) -> Dict[str, Any]:
+        return self._request("GET", "/stats")
+
+    def close(self) -> None:
+        self.conn.close()
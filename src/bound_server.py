@@ -0,0 +1,401 @@
+"""
+bound_server.py — long-lived local bound-query service
+
+Keeps the Fisher helpers and the precomputed tables of `bound_tables`
+warm in one process and answers batched vector queries over HTTP/1.1
+(TCP on localhost, or a Unix socket), so client tools need neither numpy
+nor scipy.
+
+Endpoints:
+    POST /query        {"quantity": name, "args": {arg: number | list}}
+                       -> {"values": [...], "out_of_range": [...]}
+                       or {"queries": [...]} -> {"results": [...]}
+    GET  /quantities   argument names and defaults per quantity
+    GET  /stats        request / point / batch counters, latency quantiles,
+                       throughput and mean coalesced batch size
+
+Concurrent requests for the same quantity are coalesced: requests parsed
+in the same event-loop iteration (or within `window` seconds, if set) are
+concatenated into a single NumPy call and the result is split back per
+request. Queries are validated before they join a batch; should a batch
+still fail, its members are re-run one by one so that only the offending
+request gets the error.
+
+Quantities:
+    delta_t_min(phi, alpha)                 CTRW localization table
+    delta_gamma_min(T, gamma, D_star=1)     OU bound (table, ∝ sqrt(D*))
+    t_star(gamma)                           Ramsey optimal time table
+    delta_phi_inf(t, visibility=1, D_star=1, gamma=0)
+    fisher_noise(rate, T, gamma_noise=0)    noise-suppressed I_T, constant rate
+
+Usage:
+    python -m src.bound_server --port 0          # prints the chosen port
+    python -m src.bound_server --unix /tmp/drt.sock
+    python -m src.bound_server --selftest        # localhost round trip
+Client side: `src.bound_client.BoundClient` (stdlib only).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.bound_tables import load_table
+from src.meeting_point import delta_inf_interferometer
+from src.fisher.noise_bounds import fisher_upper_bound_constant
+
+QuantityFn = Callable[..., Tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass(frozen=True)
+class Quantity:
+    """A servable bound: f(**args) -> (values, out_of_range)."""
+
+    args: Tuple[str, ...]
+    defaults: Dict[str, float]
+    fn: QuantityFn
+    validate: Optional[Callable[..., None]] = None  # validate(**args); raises ValueError
+
+
+def non_negative(*names: str) -> Callable[..., None]:
+    """Validator: the named arguments must be ≥ 0 (and not NaN)."""
+
+    def check(**a):
+        for name in names:
+            if not np.all(a[name] >= 0.0):
+                raise ValueError(f"{name} must be non-negative")
+
+    return check
+
+
+def build_quantities() -> Dict[str, Quantity]:
+    """Load (and, if stale, build) the tables; return the quantity registry."""
+    dt_table = load_table("delta_t_min")
+    dg_table = load_table("delta_gamma_min")
+    ts_table = load_table("t_star")
+
+    def from_table(table, scale=None):
+        def fn(**a):
+            coords = [a[name] for name in table.axes]
+            values, _, out = table.query(*coords)
+            if scale is not None:
+                values = values * scale(a)
+            return values, out
+
+        return fn
+
+    def direct(f):
+        def fn(**a):
+            values = np.asarray(f(**a), dtype=float)
+            return values, ~np.isfinite(values)
+
+        return fn
+
+    return {
+        "delta_t_min": Quantity(("phi", "alpha"), {}, from_table(dt_table)),
+        "delta_gamma_min": Quantity(
+            ("T", "gamma", "D_star"),
+            {"D_star": 1.0},
+            from_table(dg_table, scale=lambda a: np.sqrt(a["D_star"] / dg_table.meta["params"]["D_star"])),
+        ),
+        "t_star": Quantity(("gamma",), {}, from_table(ts_table)),
+        "delta_phi_inf": Quantity(
+            ("t", "visibility", "D_star", "gamma"),
+            {"visibility": 1.0, "D_star": 1.0, "gamma": 0.0},
+            direct(delta_inf_interferometer),
+        ),
+        "fisher_noise": Quantity(
+            ("rate", "T", "gamma_noise"),
+            {"gamma_noise": 0.0},
+            direct(lambda rate, T, gamma_noise: fisher_upper_bound_constant(rate, T, gamma_noise)),
+            validate=non_negative("gamma_noise"),
+        ),
+    }
+
+
+@dataclass
+class ServerStats:
+    """Counters exposed at /stats."""
+
+    started: float = field(default_factory=time.perf_counter)
+    requests: int = 0
+    queries: int = 0
+    points: int = 0
+    batches: int = 0
+    errors: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=10_000))
+    per_quantity: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def record_batch(self, name: str, n_queries: int, n_points: int) -> None:
+        self.batches += 1
+        q = self.per_quantity.setdefault(name, {"queries": 0, "points": 0, "batches": 0})
+        q["queries"] += n_queries
+        q["points"] += n_points
+        q["batches"] += 1
+
+    def as_dict(self) -> dict:
+        uptime = time.perf_counter() - self.started
+        lat = np.asarray(self.latencies, dtype=float)
+        q = np.quantile(lat, [0.5, 0.9, 0.99]) * 1e6 if lat.size else [float("nan")] * 3
+        return {
+            "uptime_s": uptime,
+            "requests": self.requests,
+            "queries": self.queries,
+            "points": self.points,
+            "batches": self.batches,
+            "errors": self.errors,
+            "queries_per_batch": self.queries / self.batches if self.batches else 0.0,
+            "points_per_s": self.points / uptime if uptime > 0 else 0.0,
+            "latency_us_p50_p90_p99": [float(x) for x in q],
+            "per_quantity": self.per_quantity,
+        }
+
+
+class Coalescer:
+    """Merges concurrent requests for one quantity into single NumPy calls."""
+
+    def __init__(self, name: str, quantity: Quantity, stats: ServerStats, window: float, max_points: int):
+        self.name = name
+        self.quantity = quantity
+        self.stats = stats
+        self.window = window
+        self.max_points = max_points
+        self.pending: List[Tuple[Dict[str, np.ndarray], asyncio.Future]] = []
+        self.n_pending = 0
+        self.handle: Optional[asyncio.Handle] = None
+
+    def submit(self, args: Dict[str, np.ndarray]) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self.pending.append((args, fut))
+        self.n_pending += next(iter(args.values())).size
+        if self.n_pending >= self.max_points:
+            self.flush()
+        elif self.handle is None:
+            self.handle = loop.call_later(self.window, self.flush) if self.window > 0 else loop.call_soon(self.flush)
+        return fut
+
+    def flush(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        batch, self.pending, self.n_pending = self.pending, [], 0
+        if batch:
+            self._run(batch)
+
+    def _run(self, batch) -> None:
+        sizes = np.array([next(iter(a.values())).size for a, _ in batch])
+        try:
+            values, out = self._evaluate([a for a, _ in batch])
+        except Exception as exc:  # a bad batch fails its requests, not the server
+            if len(batch) > 1:
+                for item in batch:  # re-run one by one: only the offending request fails
+                    self._run([item])
+            elif not batch[0][1].done():
+                batch[0][1].set_exception(exc)
+            return
+        self.stats.record_batch(self.name, len(batch), int(sizes.sum()))
+        cuts = np.cumsum(sizes)[:-1]
+        for (_, fut), v, o in zip(batch, np.split(values, cuts), np.split(out, cuts)):
+            if not fut.done():
+                fut.set_result((v, o))
+
+    def _evaluate(self, args: List[Dict[str, np.ndarray]]):
+        cat = {k: np.concatenate([a[k] for a in args]) for k in self.quantity.args}
+        values, out = self.quantity.fn(**cat)
+        values = np.broadcast_to(values, cat[self.quantity.args[0]].shape)
+        return values, np.broadcast_to(out, values.shape)
+
+
+class BoundServer:
+    """asyncio HTTP/1.1 front end over the quantity registry."""
+
+    def __init__(self, quantities: Dict[str, Quantity], window: float = 0.0, max_points: int = 1 << 20):
+        self.quantities = quantities
+        self.stats = ServerStats()
+        self.coalescers = {
+            name: Coalescer(name, q, self.stats, window, max_points) for name, q in quantities.items()
+        }
+
+    def _prepare(self, query: dict):
+        if not isinstance(query, dict):
+            raise ValueError("each query must be a JSON object")
+        name = query.get("quantity")
+        if name not in self.quantities:
+            raise ValueError(f"unknown quantity: {name!r}")
+        spec = self.quantities[name]
+        given = query.get("args", {})
+        if not isinstance(given, dict):
+            raise ValueError(f"{name}: args must be a JSON object")
+        unknown = set(given) - set(spec.args)
+        if unknown:
+            raise ValueError(f"{name}: unknown argument(s) {sorted(unknown)}")
+        missing = [a for a in spec.args if a not in given and a not in spec.defaults]
+        if missing:
+            raise ValueError(f"{name}: missing argument(s) {missing}")
+        arrays = [np.asarray(given.get(a, spec.defaults.get(a)), dtype=float) for a in spec.args]
+        shaped = np.broadcast_arrays(*arrays)
+        args = {a: x.ravel() for a, x in zip(spec.args, shaped)}
+        if spec.validate is not None:
+            spec.validate(**args)
+        return name, shaped[0].shape, args
+
+    async def evaluate(self, payload: dict) -> dict:
+        """Answer one /query payload (single query or {"queries": [...]})."""
+        if not isinstance(payload, dict):
+            raise ValueError("query body must be a JSON object")
+        queries = payload["queries"] if "queries" in payload else [payload]
+        if not isinstance(queries, list):
+            raise ValueError("queries must be a JSON array")
+        prepared = [self._prepare(q) for q in queries]
+        futures = [self.coalescers[name].submit(args) for name, _, args in prepared]
+        results = []
+        for (_, shape, _), (values, out) in zip(prepared, await asyncio.gather(*futures)):
+            self.stats.queries += 1
+            self.stats.points += values.size
+            results.append({"values": values.reshape(shape).tolist(), "out_of_range": out.reshape(shape).tolist()})
+        return {"results": results} if "queries" in payload else results[0]
+
+    async def _route(self, method: str, path: str, body: bytes):
+        if method == "GET" and path == "/stats":
+            return 200, self.stats.as_dict()
+        if method == "GET" and path == "/quantities":
+            return 200, {n: {"args": list(q.args), "defaults": q.defaults} for n, q in self.quantities.items()}
+        if method == "POST" and path == "/query":
+            try:
+                return 200, await self.evaluate(json.loads(body or b"{}"))
+            except (ValueError, KeyError, TypeError) as exc:
+                self.stats.errors += 1
+                return 400, {"error": str(exc)}
+        return 404, {"error": f"no route for {method} {path}"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                t0 = time.perf_counter()
+                method, path, _ = line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = h.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, obj = await self._route(method, path, body)
+                close = headers.get("connection", "").lower() == "close"
+                await self._respond(writer, status, obj, close)
+                self.stats.requests += 1
+                self.stats.latencies.append(time.perf_counter() - t0)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            self.stats.errors += 1
+        except Exception as exc:  # malformed request or internal error: reply, then close
+            self.stats.errors += 1
+            try:
+                await self._respond(writer, 400 if isinstance(exc, ValueError) else 500, {"error": str(exc)}, True)
+            except (ConnectionError, RuntimeError):
+                pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, obj: dict, close: bool) -> None:
+        data = json.dumps(obj).encode("utf-8")
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+            ).encode("latin-1")
+            + data
+        )
+        await writer.drain()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None):
+        if unix_path:
+            return await asyncio.start_unix_server(self.handle, path=unix_path)
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def _selftest(server: BoundServer, n_clients: int = 64, n_points: int = 16) -> dict:
+    """Concurrent raw-HTTP clients on localhost; checks values against direct calls."""
+    srv = await server.start("127.0.0.1", 0)
+    port = srv.sockets[0].getsockname()[1]
+    rng = np.random.default_rng(0)
+    reference = load_table("delta_t_min")
+
+    async def post(body: bytes):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            b"POST /query HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+        raw = await reader.read()
+        writer.close()
+        head, _, data = raw.partition(b"\r\n\r\n")
+        return int(head.split(b" ", 2)[1]), json.loads(data)
+
+    async def one(i):
+        phi = (10.0 ** rng.uniform(1, 5, n_points)).tolist()
+        _, reply = await post(json.dumps({"quantity": "delta_t_min", "args": {"phi": phi, "alpha": 0.6}}).encode())
+        want, _, _ = reference.query(np.asarray(phi), 0.6)
+        return float(np.max(np.abs(np.asarray(reply["values"]) / want - 1.0)))
+
+    # Valid JSON of the wrong shape, and invalid JSON: client errors (400).
+    malformed = [b"[1, 2]", b'{"queries": [[1]]}', b'{"queries": 3}', b'{"quantity": "delta_t_min", "args": [1, 2]}', b"{"]
+
+    async with srv:
+        errs = await asyncio.gather(*(one(i) for i in range(n_clients)))
+        statuses = [status for status, _ in await asyncio.gather(*(post(b) for b in malformed))]
+    stats = server.stats.as_dict()
+    stats["max_rel_mismatch"] = max(errs)
+    stats["malformed_statuses"] = statuses
+    stats["malformed_rejected"] = all(status == 400 for status in statuses)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local DRT bound-query service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port (printed)")
+    parser.add_argument("--unix", default=None, help="serve on a Unix socket instead of TCP")
+    parser.add_argument("--window", type=float, default=0.0, help="coalescing window [s]; 0 = same loop iteration")
+    parser.add_argument("--selftest", action="store_true", help="run a localhost round trip and exit")
+    args = parser.parse_args()
+
+    server = BoundServer(build_quantities(), window=args.window)
+
+    if args.selftest:
+        print(json.dumps(asyncio.run(_selftest(server)), indent=2))
+        return
+
+    async def serve():
+        srv = await server.start(args.host, args.port, args.unix)
+        where = args.unix or "%s:%d" % srv.sockets[0].getsockname()[:2]
+        print(f"DRT bound server listening on {where}", flush=True)
+        async with srv:
+            await srv.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+bound_tables.py — precomputed DRT bound tables with a vectorized query API
+
+Planning loops query bounds such as
+
+    δt_min(Φ, α)   E[δt] of the CTRW localization statistic (`ctrw_mc`),
+    δγ_min(T, γ)   `ou_fisher.gamma_min_bound`,
+    t*(Γ)          `optimize_t_star_batch` (Ramsey under dephasing),
+
+far too often to rerun a Monte Carlo or a quadrature per query. Each bound
+is tabulated once on a tensor grid that is refined adaptively per axis
+(midpoints are inserted wherever log-log linear interpolation misses the
+true value by more than `rtol`), and stored under results/tables/ as
+
+    <name>.logv.npy   log values (memory-mapped on load),
+    <name>.err.npy    estimated relative interpolation error per node,
+    <name>.json       axes, node coordinates, build parameters, source hash.
+
+A table is rebuilt only when the hash of its source modules (and build
+parameters) changes. Queries interpolate multilinearly in (log) axis and
+log value space; points outside the table are extrapolated from the edge
+cells and flagged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import inspect
+import itertools
+import json
+import os
+import warnings
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.config import PATHS
+from src.io_utils import ensure_dir, load_json, open_memmap, save_json
+
+TABLES_SUBDIR = "tables"
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """How to build one bound table."""
+
+    name: str
+    axes: Tuple[str, ...]
+    bounds: Tuple[Tuple[float, float], ...]
+    log_axes: Tuple[bool, ...]
+    func: Callable[..., np.ndarray]
+    sources: Tuple[str, ...]
+    params: Dict[str, float] = field(default_factory=dict)
+    description: str = ""
+
+
+def _delta_t_min(phi, alpha):
+    from src.sims.ctrw_mc import delta_t_expected
+
+    return delta_t_expected(phi, alpha)
+
+
+def _delta_gamma_min(T, gamma, D_star=1.0):
+    from src.fisher.ou_fisher import gamma_min_bound
+
+    return gamma_min_bound(T, gamma, D_star=D_star)
+
+
+def _t_star(gamma, r=1.0, D_star=1.0, t_lo=1e-4, t_hi=10.0):
+    from src.sims.ramsey_optimal_time_under_dephasing import optimize_t_star_batch
+
+    return optimize_t_star_batch(gamma, r=r, D_star=D_star, t_bounds=(t_lo, t_hi))["t_star"]
+
+
+TABLES: Dict[str, TableSpec] = {
+    spec.name: spec
+    for spec in (
+        TableSpec(
+            name="delta_t_min",
+            axes=("phi", "alpha"),
+            bounds=((1.0, 1.0e6), (0.1, 1.0)),
+            log_axes=(True, False),
+            func=_delta_t_min,
+            sources=("src.sims.ctrw_mc",),
+            description="E[delta_t] of the CTRW Poisson localization statistic",
+        ),
+        TableSpec(
+            name="delta_gamma_min",
+            axes=("T", "gamma"),
+            bounds=((1.0e-2, 1.0e6), (1.0e-4, 1.0e4)),
+            log_axes=(True, True),
+            func=_delta_gamma_min,
+            sources=("src.fisher.ou_fisher",),
+            params={"D_star": 1.0},
+            description="OU delta_gamma_min = sqrt(4 D* gamma / T)",
+        ),
+        TableSpec(
+            name="t_star",
+            axes=("gamma",),
+            bounds=((1.0e-4, 1.0e4),),
+            log_axes=(True,),
+            func=_t_star,
+            sources=("src.sims.ramsey_optimal_time_under_dephasing",),
+            params={"r": 1.0, "D_star": 1.0, "t_lo": 1.0e-4, "t_hi": 10.0},
+            description="Ramsey t*(Gamma) maximizing r t^2 exp(-2 Gamma t) on [t_lo, t_hi]",
+        ),
+    )
+}
+
+
+def source_hash(spec: TableSpec) -> str:
+    """sha256 over the source modules, this builder and the build parameters."""
+    h = hashlib.sha256()
+    for mod in (__name__,) + tuple(spec.sources):
+        h.update(inspect.getsource(importlib.import_module(mod)).encode("utf-8"))
+    h.update(json.dumps({"bounds": spec.bounds, "params": spec.params}, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _to_u(x, log: bool):
+    return np.log(x) if log else np.asarray(x, dtype=float)
+
+
+def _from_u(u, log: bool):
+    return np.exp(u) if log else np.asarray(u, dtype=float)
+
+
+def _evaluate(spec: TableSpec, u_axes: Sequence[np.ndarray]) -> np.ndarray:
+    """log f on the tensor grid spanned by u_axes."""
+    d = len(u_axes)
+    coords = [
+        _from_u(u, lg).reshape((1,) * k + (-1,) + (1,) * (d - k - 1))
+        for k, (u, lg) in enumerate(zip(u_axes, spec.log_axes))
+    ]
+    shape = tuple(u.size for u in u_axes)
+    values = np.broadcast_to(np.asarray(spec.func(*coords, **spec.params), dtype=float), shape)
+    if np.any(~(values > 0)):
+        raise ValueError(f"table {spec.name}: bound must be positive and finite for log interpolation")
+    return np.log(values)
+
+
+def _midpoint_errors(spec: TableSpec, u_axes: List[np.ndarray], logv: np.ndarray) -> List[np.ndarray]:
+    """Per axis: |log f(mid) - linear interpolation| on every cell midpoint."""
+    errs = []
+    for k, u in enumerate(u_axes):
+        mids = list(u_axes)
+        mids[k] = 0.5 * (u[:-1] + u[1:])
+        exact = _evaluate(spec, mids)
+        lo = np.take(logv, np.arange(u.size - 1), axis=k)
+        hi = np.take(logv, np.arange(1, u.size), axis=k)
+        errs.append(np.abs(exact - 0.5 * (lo + hi)))
+    return errs
+
+
+def build_table(
+    spec: TableSpec,
+    rtol: float = 1e-4,
+    initial_nodes: int = 9,
+    max_nodes: int = 2049,
+    max_rounds: int = 40,
+    min_width: float = 1e-9,
+) -> dict:
+    """
+    Adaptively tabulate `spec` and write it to results/tables/.
+
+    Parameters
+    ----------
+    rtol : float
+        Target relative interpolation error (log-space error at midpoints).
+    initial_nodes : int
+        Starting uniform nodes per axis (uniform in log for log axes).
+    max_nodes : int
+        Node cap per axis; the worst cells are refined first.
+    max_rounds : int
+        Maximum refinement sweeps.
+    min_width : float
+        Cells narrower than this (in axis coordinates) are not split.
+
+    Returns
+    -------
+    dict
+        The table metadata (also written as <name>.json).
+    """
+    u_axes = [np.linspace(_to_u(a, lg), _to_u(b, lg), initial_nodes) for (a, b), lg in zip(spec.bounds, spec.log_axes)]
+
+    converged = False
+    for _ in range(max_rounds):
+        logv = _evaluate(spec, u_axes)
+        errs = _midpoint_errors(spec, u_axes, logv)
+        refined = False
+        for k, (u, e) in enumerate(zip(u_axes, errs)):
+            cell_err = e.max(axis=tuple(j for j in range(e.ndim) if j != k))
+            bad = np.flatnonzero((cell_err > rtol) & (np.diff(u) > min_width))
+            room = max_nodes - u.size
+            if bad.size == 0 or room <= 0:
+                continue
+            if bad.size > room:
+                bad = bad[np.argsort(cell_err[bad])[::-1][:room]]
+            u_axes[k] = np.sort(np.concatenate([u, 0.5 * (u[bad] + u[bad + 1])]))
+            refined = True
+        if not refined:
+            converged = True
+            break
+
+    logv = _evaluate(spec, u_axes)
+    errs = _midpoint_errors(spec, u_axes, logv)
+    node_err = np.zeros(logv.shape)
+    for k, e in enumerate(errs):
+        pad = [(0, 0)] * e.ndim
+        left, right = list(pad), list(pad)
+        left[k], right[k] = (1, 0), (0, 1)
+        node_err = np.maximum(node_err, np.maximum(np.pad(e, left), np.pad(e, right)))
+    node_err = np.expm1(node_err)
+
+    ensure_dir(os.path.join(PATHS.results_dir, TABLES_SUBDIR))
+    base = f"{TABLES_SUBDIR}/{spec.name}"
+    for suffix, arr in ((".logv.npy", logv), (".err.npy", node_err)):
+        mm = open_memmap(base + suffix, shape=arr.shape, dtype=np.float64)
+        mm[...] = arr
+        mm.flush()
+        del mm
+
+    meta = {
+        "name": spec.name,
+        "description": spec.description,
+        "axes": list(spec.axes),
+        "log_axes": list(spec.log_axes),
+        "nodes": [_from_u(u, lg).tolist() for u, lg in zip(u_axes, spec.log_axes)],
+        "params": dict(spec.params),
+        "rtol": rtol,
+        "converged": converged,
+        "max_rel_err": float(node_err.max()),
+        "source_hash": source_hash(spec),
+    }
+    save_json(base + ".json", meta)
+    return meta
+
+
+@dataclass(frozen=True)
+class BoundTable:
+    """A loaded table; call it like the bound it tabulates."""
+
+    name: str
+    axes: Tuple[str, ...]
+    log_axes: Tuple[bool, ...]
+    u_nodes: Tuple[np.ndarray, ...]
+    log_values: np.ndarray
+    err: np.ndarray
+    meta: dict
+
+    def _corners(self, coords):
+        if len(coords) != len(self.axes):
+            raise ValueError(f"table {self.name} expects coordinates {self.axes}")
+        coords = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in coords))
+        idx, w = [], []
+        out = np.zeros(coords[0].shape, dtype=bool)
+        for x, u, lg in zip(coords, self.u_nodes, self.log_axes):
+            ux = _to_u(x, lg)
+            out |= ~((ux >= u[0]) & (ux <= u[-1]))
+            i = np.clip(np.searchsorted(u, ux, side="right") - 1, 0, u.size - 2)
+            idx.append(i)
+            w.append((ux - u[i]) / (u[i + 1] - u[i]))
+        return idx, w, out
+
+    @staticmethod
+    def _interp(grid, idx, w):
+        acc = 0.0
+        for corner in itertools.product((0, 1), repeat=len(idx)):
+            weight = 1.0
+            for c, wk in zip(corner, w):
+                weight = weight * (wk if c else 1.0 - wk)
+            acc = acc + weight * grid[tuple(i + c for i, c in zip(idx, corner))]
+        return acc
+
+    def query(self, *coords):
+        """
+        Interpolated bound at broadcast coordinates.
+
+        Returns
+        -------
+        values, rel_err, out_of_range : np.ndarray
+            Values, interpolated node error estimate, and the mask of
+            points that were extrapolated (or are not finite / not > 0
+            on a log axis).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            idx, w, out = self._corners(coords)
+            values = np.exp(self._interp(self.log_values, idx, w))
+            err = self._interp(self.err, idx, [np.clip(wk, 0.0, 1.0) for wk in w])
+        return values[()], np.asarray(err)[()], out[()]
+
+    def __call__(self, *coords):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            idx, w, out = self._corners(coords)
+            values = np.exp(self._interp(self.log_values, idx, w))
+        if out.any():
+            warnings.warn(
+                f"{self.name}: {int(np.count_nonzero(out))} point(s) outside the table were extrapolated",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return values[()]
+
+
+def is_stale(name: str) -> bool:
+    """True if the table is missing or its source hash no longer matches."""
+    try:
+        meta = load_json(f"{TABLES_SUBDIR}/{name}.json")
+    except FileNotFoundError:
+        return True
+    return meta.get("source_hash") != source_hash(TABLES[name])
+
+
+def load_table(name: str, rebuild: Optional[bool] = None, **build_kwargs) -> BoundTable:
+    """
+    Load a table (memory-mapped), rebuilding it if stale or if rebuild=True.
+    """
+    spec = TABLES[name]
+    if rebuild or (rebuild is None and is_stale(name)):
+        build_table(spec, **build_kwargs)
+    meta = load_json(f"{TABLES_SUBDIR}/{name}.json")
+    return BoundTable(
+        name=name,
+        axes=tuple(meta["axes"]),
+        log_axes=tuple(meta["log_axes"]),
+        u_nodes=tuple(_to_u(np.asarray(n), lg) for n, lg in zip(meta["nodes"], meta["log_axes"])),
+        # Plain ndarray views of the maps (same pages, no np.memmap indexing overhead).
+        log_values=open_memmap(f"{TABLES_SUBDIR}/{name}.logv.npy", mode="r").view(np.ndarray),
+        err=open_memmap(f"{TABLES_SUBDIR}/{name}.err.npy", mode="r").view(np.ndarray),
+        meta=meta,
+    )
+
+
+def main():
+    import time
+
+    rng = np.random.default_rng(0)
+    for name, spec in TABLES.items():
+        t0 = time.perf_counter()
+        table = load_table(name)
+        t_build = time.perf_counter() - t0
+
+        coords = [
+            _from_u(rng.uniform(_to_u(a, lg), _to_u(b, lg), 100_000), lg)
+            for (a, b), lg in zip(spec.bounds, spec.log_axes)
+        ]
+        t0 = time.perf_counter()
+        values, _, _ = table.query(*coords)
+        t_batch = (time.perf_counter() - t0) / 100_000
+
+        exact = np.asarray(spec.func(*coords, **spec.params), dtype=float)
+        worst = float(np.max(np.abs(values / exact - 1.0)))
+        print(
+            "%-16s nodes=%-12s max_err(est)=%.2e max_err(check)=%.2e load/build=%.2fs query=%.2fus/pt"
+            % (
+                name,
+                "x".join(str(len(n)) for n in table.meta["nodes"]),
+                table.meta["max_rel_err"],
+                worst,
+                t_build,
+                1e6 * t_batch,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
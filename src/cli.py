@@ -0,0 +1,230 @@
+"""
+cli.py — unified command line for the DRT pipeline (`python -m src`)
+
+    python -m src list
+    python -m src sim   [names/globs] [--jobs N] [--profile quick] [--only ...] [--skip ...]
+    python -m src sweep [names/globs]
+    python -m src figs  [names/globs]
+    python -m src bench [names/globs]          # wall time + peak RSS per stage
+    python -m src cache status|build|clear
+
+Global options (accepted before or after the subcommand):
+    --jobs N            parallel stages (sim/figs) or sweep workers (sweep)
+    --backend B         sweep workers: auto | serial | process | thread
+    --profile P         budget profile: quick | default | production
+    --mem-budget SIZE   working-memory budget for chunked sims, e.g. 2G
+    --seed S            global seed (RNG_DEFAULT.seed)
+    --only / --skip     glob patterns on stage names
+
+Options are exported as DRT_* environment variables (see `src.config`)
+before any stage is imported, so they also reach worker processes. Only
+argparse / subprocess are loaded up front; numpy and friends are
+imported by the stages that need them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from src import registry
+
+PROFILE_NAMES = ("quick", "default", "production")
+BACKEND_NAMES = ("auto", "serial", "process", "thread")  # src.executor.BACKENDS (numpy-free here)
+
+
+def _common_options(parser: argparse.ArgumentParser, suppress: bool) -> None:
+    default = argparse.SUPPRESS if suppress else None
+    parser.add_argument("--jobs", "-j", type=int, default=argparse.SUPPRESS if suppress else 1)
+    parser.add_argument("--backend", choices=BACKEND_NAMES, default=default)
+    parser.add_argument("--profile", choices=PROFILE_NAMES, default=default)
+    parser.add_argument("--mem-budget", default=default)
+    parser.add_argument("--seed", type=int, default=default)
+    parser.add_argument("--only", action="append", default=argparse.SUPPRESS if suppress else [])
+    parser.add_argument("--skip", action="append", default=argparse.SUPPRESS if suppress else [])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src", description="DRT pipeline runner.")
+    _common_options(parser, suppress=False)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name, help_text):
+        p = sub.add_parser(name, help=help_text)
+        _common_options(p, suppress=True)
+        return p
+
+    add("list", "list registered stages")
+    for name, help_text in (("sim", "run simulations"), ("sweep", "run parameter sweeps"), ("figs", "generate figures")):
+        add(name, help_text).add_argument("names", nargs="*", help="stage names or globs")
+    bench = add("bench", "time stages (fresh process each; default profile: quick)")
+    bench.add_argument("names", nargs="*")
+    bench.add_argument("--kind", choices=registry.KINDS, action="append")
+    cache = add("cache", "bound tables and memory-mapped results")
+    cache.add_argument("action", choices=("status", "build", "clear"))
+    cache.add_argument("--force", action="store_true", help="rebuild even if fresh")
+    return parser
+
+
+def apply_environment(args: argparse.Namespace) -> None:
+    """Export options as DRT_* variables read by `src.config` at import."""
+    if args.profile:
+        os.environ["DRT_PROFILE"] = args.profile
+    if args.backend:
+        os.environ["DRT_BACKEND"] = args.backend
+    if args.mem_budget:
+        os.environ["DRT_MEM_BUDGET"] = str(args.mem_budget)
+    if args.seed is not None:
+        os.environ["DRT_SEED"] = str(args.seed)
+    os.environ["DRT_JOBS"] = str(args.jobs)
+
+
+def _run_inprocess(stage: registry.Stage) -> bool:
+    print(f"[{stage.kind}] {stage.name} — {stage.title}", flush=True)
+    try:
+        importlib.import_module(stage.module).main()
+    except Exception as exc:  # report and continue with the next stage
+        print(f"[FAILED] {stage.name}: {type(exc).__name__}: {exc}", flush=True)
+        return False
+    return True
+
+
+def _run_subprocess(stage: registry.Stage) -> bool:
+    env = dict(os.environ, DRT_JOBS="1")
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-m", stage.module], env=env, capture_output=True, text=True)
+    status = "ok" if proc.returncode == 0 else f"FAILED ({proc.returncode})"
+    print(f"[{stage.kind}] {stage.name} — {status} in {time.perf_counter() - t0:.1f}s", flush=True)
+    text = (proc.stdout + proc.stderr).strip()
+    if text:
+        print("    " + text.replace("\n", "\n    "), flush=True)
+    return proc.returncode == 0
+
+
+def run_stages(stages: Sequence[registry.Stage], jobs: int) -> int:
+    """Run stages in order (jobs = 1) or as a pool of subprocesses."""
+    if not stages:
+        print("No stages selected.")
+        return 0
+    if jobs <= 1 or len(stages) == 1:
+        ok = [_run_inprocess(s) for s in stages]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            ok = list(pool.map(_run_subprocess, stages))
+    failed = [s.name for s, good in zip(stages, ok) if not good]
+    if failed:
+        print(f"{len(failed)} stage(s) failed: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+def bench(stages: Sequence[registry.Stage]) -> int:
+    """Wall time and peak RSS of each stage in a fresh interpreter."""
+    rows = []
+    for stage in stages:
+        with tempfile.TemporaryFile() as err_file:
+            t0 = time.perf_counter()
+            proc = subprocess.Popen([sys.executable, "-m", stage.module], stdout=subprocess.DEVNULL, stderr=err_file)
+            _, status, usage = os.wait4(proc.pid, 0)
+            wall = time.perf_counter() - t0
+            code = proc.returncode = os.waitstatus_to_exitcode(status)
+            err_file.seek(0)
+            err = err_file.read().decode(errors="replace").strip().splitlines()
+        rows.append(
+            {
+                "stage": stage.name,
+                "kind": stage.kind,
+                "ok": code == 0,
+                "wall_s": wall,
+                "cpu_s": usage.ru_utime + usage.ru_stime,
+                "max_rss_mb": usage.ru_maxrss / 1024.0,
+                "error": err[-1] if code != 0 and err else "",
+            }
+        )
+        r = rows[-1]
+        print(
+            "%-38s %-5s %8.2fs wall %8.2fs cpu %8.1f MB%s"
+            % (r["stage"], r["kind"], r["wall_s"], r["cpu_s"], r["max_rss_mb"], "" if r["ok"] else "  FAILED: " + r["error"]),
+            flush=True,
+        )
+
+    from src.config import RNG_DEFAULT, RUNTIME
+    from src.io_utils import save_json
+
+    save_json(
+        "bench.json",
+        {"profile": RUNTIME.profile.name, "seed": RNG_DEFAULT.seed, "mem_budget": RUNTIME.mem_budget, "stages": rows},
+    )
+    print("Benchmark written: results/bench.json")
+    return 0 if all(r["ok"] for r in rows) else 1
+
+
+def cache(action: str, force: bool) -> int:
+    from src import bound_tables
+    from src.config import PATHS
+
+    tables_dir = os.path.join(PATHS.results_dir, bound_tables.TABLES_SUBDIR)
+    memmaps = []
+    if os.path.isdir(PATHS.results_dir):
+        memmaps = sorted(
+            os.path.join(PATHS.results_dir, f) for f in os.listdir(PATHS.results_dir) if f.endswith(".npy")
+        )
+
+    if action == "status":
+        for name in bound_tables.TABLES:
+            print(f"table  {name:<18} {'stale' if bound_tables.is_stale(name) else 'fresh'}")
+        for path in memmaps:
+            print(f"memmap {path:<40} {os.path.getsize(path) / 2**20:10.1f} MB")
+    elif action == "build":
+        for name in bound_tables.TABLES:
+            if force or bound_tables.is_stale(name):
+                meta = bound_tables.build_table(bound_tables.TABLES[name])
+                print(f"built  {name:<18} max_rel_err={meta['max_rel_err']:.2e}")
+            else:
+                print(f"fresh  {name}")
+    else:
+        if os.path.isdir(tables_dir):
+            shutil.rmtree(tables_dir)
+            print(f"removed {tables_dir}")
+        for path in memmaps:
+            os.remove(path)
+            print(f"removed {path}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "bench" and not args.profile:
+        args.profile = "quick"
+    apply_environment(args)
+
+    if args.command == "list":
+        for s in registry.select(only=args.only, skip=args.skip):
+            print(f"{s.kind:<6} {s.name:<38} {s.title}")
+        for mod in registry.unregistered():
+            print(f"(unregistered) {mod}")
+        return 0
+
+    if args.command == "cache":
+        return cache(args.action, args.force)
+
+    kinds = {"sim": ["sim"], "sweep": ["sweep"], "figs": ["fig"]}.get(args.command)
+    if args.command == "bench":
+        kinds = args.kind or ["sim", "sweep"]
+    try:
+        stages = registry.select(kinds=kinds, names=args.names, only=args.only, skip=args.skip)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.command == "bench":
+        return bench(stages)
+    # Sweeps parallelize inside (executor workers); sims and figs across stages.
+    return run_stages(stages, 1 if args.command == "sweep" else args.jobs)
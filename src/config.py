@@ -4,11 +4,21 @@ config.py — central configuration (single source of truth)
 Keep parameters here when they are shared between sims/figs.
 Per-script parameters may still live at top of each script, but
 defaults should reference this module.
+
+Run-time options of the `python -m src` CLI reach every module (also in
+worker processes) through environment variables read at import time:
+    DRT_SEED        global seed (RNG_DEFAULT.seed)
+    DRT_PROFILE     budget profile: quick | default | production
+    DRT_JOBS        workers for parallel sweeps
+    DRT_BACKEND     sweep workers: auto | serial | process | thread
+    DRT_MEM_BUDGET  working-memory budget, e.g. "512M", "4G"
+    DRT_KERNELS     per-lane kernels (`src.kernels`): auto | numba | numpy
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -23,7 +33,7 @@ PATHS = Paths()
 @dataclass(frozen=True)
 class RNG:
     # Global default seed. Each script may derive sub-seeds deterministically.
-    seed: int = 123456
+    seed: int = field(default_factory=lambda: int(os.environ.get("DRT_SEED", 123456)))
 
 
 RNG_DEFAULT = RNG()
@@ -37,3 +47,49 @@ class SimulationDefaults:
 
 
 SIM_DEFAULTS = SimulationDefaults()
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    # Multiplies Monte Carlo sample counts (trajectories, lanes, repetitions).
+    scale: float
+
+
+PROFILES = {
+    "quick": Profile("quick", 0.1),
+    "default": Profile("default", 1.0),
+    "production": Profile("production", 5.0),
+}
+
+
+def parse_bytes(text: str) -> int:
+    """'512M', '4G', '1.5e9' -> bytes."""
+    text = str(text).strip().upper().rstrip("B")
+    units = {"K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(float(text))
+
+
+@dataclass(frozen=True)
+class Runtime:
+    profile: Profile = field(default_factory=lambda: PROFILES[os.environ.get("DRT_PROFILE", "default")])
+    jobs: int = field(default_factory=lambda: int(os.environ.get("DRT_JOBS", 1)))
+    backend: str = field(default_factory=lambda: os.environ.get("DRT_BACKEND", "auto"))
+    kernels: str = field(default_factory=lambda: os.environ.get("DRT_KERNELS", "auto"))
+    mem_budget: int = field(default_factory=lambda: parse_bytes(os.environ.get("DRT_MEM_BUDGET", "1G")))
+
+
+RUNTIME = Runtime()
+
+
+def budget(n: int, minimum: int = 2) -> int:
+    """Sample count n scaled by the active profile."""
+    return max(int(minimum), int(round(n * RUNTIME.profile.scale)))
+
+
+def budget_chunk(bytes_per_elem: int = 8, n_buffers: int = 8) -> int:
+    """Largest power of two of elements per chunk that fits the memory budget."""
+    n = max(1, RUNTIME.mem_budget // (int(bytes_per_elem) * int(n_buffers)))
+    return 1 << (n.bit_length() - 1)
@@ -0,0 +1,192 @@
+"""
+executor.py — task executor for independent Monte Carlo work items
+
+Sweeps (repetitions × parameters) are lists of independent tasks whose
+randomness is fully determined by each task's own seed, so results do
+not depend on how the tasks are scheduled. `run_tasks` maps a top-level
+function over the tasks, `run_into` additionally hands every task its own
+RNG stream and writes the results into a preallocated array.
+
+Backends (`backend=`, CLI `--backend`, env DRT_BACKEND):
+
+    serial    in-process, in task order (also whenever jobs <= 1);
+    process   process pool (`concurrent.futures`): pays fork + pickling
+              per task, right for long tasks that hold the GIL;
+    thread    thread pool: no start-up or IPC cost; chunked NumPy kernels
+              release the GIL, so short array tasks scale across cores.
+              Tasks must not touch shared state (legacy `np.random`);
+    auto      time the first task in-process and use threads when it is
+              shorter than THREAD_TASK_SECONDS, processes otherwise. The
+              choice is remembered per task function (task type).
+
+`jobs=None` uses `RUNTIME.jobs` (CLI `--jobs`, env DRT_JOBS).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.config import RUNTIME
+
+BACKENDS = ("auto", "serial", "process", "thread")
+
+# Tasks faster than this are not worth a worker process (fork + IPC).
+THREAD_TASK_SECONDS = 0.2
+
+_AUTO_CHOICE: Dict[Any, str] = {}
+
+
+def _resolve_jobs(jobs: Optional[int], n_tasks: int) -> int:
+    jobs = RUNTIME.jobs if jobs is None else int(jobs)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, n_tasks))
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    backend = RUNTIME.backend if backend is None else backend
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    return backend
+
+
+def _task_key(fn: Callable) -> Any:
+    return (getattr(fn, "__module__", None), getattr(fn, "__qualname__", repr(fn)))
+
+
+def _map(fn: Callable[[Any], Any], tasks: Sequence[Any], backend: str, jobs: int, chunksize: int) -> List[Any]:
+    if backend == "serial" or jobs == 1:
+        return [fn(t) for t in tasks]
+    if backend == "thread":
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(fn, tasks))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(fn, tasks, chunksize=max(1, int(chunksize))))
+
+
+def _plan(fn: Callable, n_tasks: int, jobs: Optional[int], backend: Optional[str], probe: Callable[[], None]):
+    """
+    (backend, jobs, n_probed): the concrete backend and worker count; for
+    "auto" without a remembered choice, probe() runs the first task here
+    and is timed (n_probed = 1).
+    """
+    backend = _resolve_backend(backend)
+    jobs = _resolve_jobs(jobs, n_tasks)
+    if jobs == 1 or backend == "serial":
+        return "serial", 1, 0
+    if backend != "auto":
+        return backend, jobs, 0
+    key = _task_key(fn)
+    if key in _AUTO_CHOICE:
+        return _AUTO_CHOICE[key], jobs, 0
+    t0 = time.perf_counter()
+    probe()
+    elapsed = time.perf_counter() - t0
+    _AUTO_CHOICE[key] = "thread" if elapsed < THREAD_TASK_SECONDS else "process"
+    return _AUTO_CHOICE[key], _resolve_jobs(jobs, n_tasks - 1), 1
+
+
+def run_tasks(
+    fn: Callable[[Any], Any],
+    tasks: Iterable[Any],
+    jobs: Optional[int] = None,
+    chunksize: int = 1,
+    backend: Optional[str] = None,
+) -> List[Any]:
+    """
+    Apply fn to every task; returns the results in task order.
+
+    Parameters
+    ----------
+    fn : callable
+        Module-level (picklable) function of one task.
+    tasks : iterable
+        Task descriptions (picklable), each carrying its own seed.
+    jobs : int, optional
+        Workers (≤ 0: one per CPU). Default: RUNTIME.jobs.
+    chunksize : int
+        Tasks sent to a worker process at a time.
+    backend : {"auto", "serial", "process", "thread"}, optional
+        Default: RUNTIME.backend.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return []
+    first = []
+    backend, jobs, n_probed = _plan(fn, len(tasks), jobs, backend, lambda: first.append(fn(tasks[0])))
+    return first + _map(fn, tasks[n_probed:], backend, jobs, chunksize)
+
+
+class _Seeded:
+    """
+    Picklable task wrapper: builds the task's RNG where the task runs and,
+    in-process (serial / thread), writes the row straight into `out`.
+    """
+
+    def __init__(self, fn: Callable[[Any, Any], Any], rng_factory: Callable[[Any], Any], out: Optional[np.ndarray] = None):
+        self.fn = fn
+        self.rng_factory = rng_factory
+        self.out = out
+
+    def __call__(self, item):
+        i, seed, task = item
+        row = self.fn(task, self.rng_factory(seed))
+        if self.out is None:
+            return row
+        self.out[i] = row
+        return None
+
+
+def run_into(
+    fn: Callable[[Any, Any], Any],
+    tasks: Iterable[Any],
+    seeds: Iterable[Any],
+    out: np.ndarray,
+    jobs: Optional[int] = None,
+    backend: Optional[str] = None,
+    rng_factory: Callable[[Any], Any] = np.random.default_rng,
+    chunksize: int = 1,
+) -> np.ndarray:
+    """
+    out[i] = fn(tasks[i], rng_factory(seeds[i])) for every task.
+
+    Each task owns its RNG stream, built inside the worker from its seed,
+    so a thread never shares a generator (or the legacy global state) with
+    another and the results do not depend on the backend or the number
+    of workers. Serial and thread workers write their row of the
+    preallocated `out` in place; process results are copied in.
+
+    Parameters
+    ----------
+    fn : callable
+        fn(task, rng) -> row; module-level for the process backend.
+    seeds : iterable
+        One seed per task, e.g. [seed, i] (`np.random.default_rng`) or an
+        int with rng_factory=np.random.RandomState (reproduces
+        `set_seed(seed)` followed by rng=None).
+    out : np.ndarray
+        Output array with len(tasks) rows.
+
+    Returns
+    -------
+    np.ndarray
+        `out`.
+    """
+    tasks, seeds = list(tasks), list(seeds)
+    if not (len(tasks) == len(seeds) == len(out)):
+        raise ValueError("need one seed and one output row per task")
+    if not tasks:
+        return out
+    items = [(i, s, t) for i, (s, t) in enumerate(zip(seeds, tasks))]
+    inplace = _Seeded(fn, rng_factory, out)
+    backend, jobs, n_probed = _plan(fn, len(items), jobs, backend, lambda: inplace(items[0]))
+    if backend == "process":
+        out[n_probed:] = _map(_Seeded(fn, rng_factory), items[n_probed:], backend, jobs, chunksize)
+    else:
+        _map(inplace, items[n_probed:], backend, jobs, chunksize)
+    return out
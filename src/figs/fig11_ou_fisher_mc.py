@@ -0,0 +1,48 @@
+"""
+fig11_ou_fisher_mc.py — OU Fisher information: trajectories vs T/(2γ)
+
+Depends on:
+- results/ou_fisher_mc.json
+
+Shows:
+- empirical I_T (± standard error) from streamed OU trajectories
+- closed form T/(2γ) for each γ
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("ou_fisher_mc.json")
+
+    gammas = np.array(data["gammas"], dtype=float)
+    T = np.array(data["T"], dtype=float)
+    I_emp = np.array(data["I_emp"], dtype=float)
+    I_se = np.array(data["I_emp_se"], dtype=float)
+    I_closed = np.array(data["I_closed"], dtype=float)
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+
+    for i, g in enumerate(gammas):
+        line = ax.errorbar(T, I_emp[i], yerr=I_se[i], fmt="o", capsize=3, label=f"MC γ={g:g}")
+        ax.plot(T, I_closed[i], "--", color=line[0].get_color())
+
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel(r"Observation time $T$")
+    ax.set_ylabel(r"Fisher information $I_T(\gamma)$")
+    ax.set_title(r"OU trajectories vs $T/(2\gamma)$ (dashed)")
+    ax.legend(frameon=False)
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig11_ou_fisher_mc.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig11 saved:", figures_path("fig11_ou_fisher_mc.pdf"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+fig12_poisson_stream.py — inhomogeneous Poisson streams: rate and score
+
+Depends on:
+- results/poisson_stream_mc.json
+
+Shows:
+- pooled event rate of the thinned streams vs the intensity λ(t; θ)
+- score histogram vs N(0, I_analytic), with empirical and analytic Fisher
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("poisson_stream_mc.json")
+
+    t_edges = np.array(data["rate_t_edges"], dtype=float)
+    t_mid = 0.5 * (t_edges[1:] + t_edges[:-1])
+    rate = np.array(data["rate_emp"], dtype=float)
+    model = np.array(data["rate_model"], dtype=float)
+    s_edges = np.array(data["score_edges"], dtype=float)
+    s_density = np.array(data["score_density"], dtype=float)
+    I_emp, I_se, I_an = data["I_emp"], data["I_emp_se"], data["I_analytic"]
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    ax1.step(t_mid, rate, where="mid", label=f"MC ({data['n_real']} streams)")
+    ax1.plot(t_mid, model, "--", label=r"$\lambda(t;\theta)$")
+    ax1.axvline(data["theta"], color="grey", lw=0.8)
+    ax1.set_yscale("log")
+    ax1.set_xlabel(r"Time $t$")
+    ax1.set_ylabel("Event rate")
+    ax1.set_title(r"Thinned streams, $\theta=%g$" % data["theta"])
+    ax1.legend(frameon=False)
+
+    s = np.linspace(s_edges[0], s_edges[-1], 400)
+    ax2.stairs(s_density, s_edges, label="MC score")
+    ax2.plot(s, np.exp(-0.5 * s**2 / I_an) / np.sqrt(2.0 * np.pi * I_an), "--", label=r"$N(0, I_\theta)$")
+    ax2.set_xlabel(r"Score $s(\theta)$")
+    ax2.set_ylabel("Density")
+    ax2.set_title(r"$\hat I = %.4g \pm %.2g$ vs $I = %.4g$" % (I_emp, I_se, I_an))
+    ax2.legend(frameon=False)
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig12_poisson_stream.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig12 saved:", figures_path("fig12_poisson_stream.pdf"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+fig13_ctrw_trajectory.py — CTRW trajectories: MSD and localization scaling
+
+Depends on:
+- results/ctrw_trajectory_mc.json
+
+Shows:
+- ensemble MSD of the simulated walkers vs t^α / Γ(1+α)
+- δt_min(Φ) from the MSD balance, with the balance exponent -1/(1+2α)
+  (expected) and the paper's ansatz -1/(2+α) for comparison
+"""
+
+import math
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("ctrw_trajectory_mc.json")
+
+    alpha = float(data["alpha"])
+    t = np.array(data["t_obs"], dtype=float)
+    msd = np.array(data["msd"], dtype=float)
+    phi = np.array(data["phi"], dtype=float)
+    dt = np.array(data["delta_t"], dtype=float)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    ax1.loglog(t, msd, "o", ms=3, label=f"MC ({data['n_walkers']} walkers, {data['law']})")
+    ax1.loglog(t, t**alpha / math.gamma(1.0 + alpha), "--", label=r"$t^\alpha/\Gamma(1+\alpha)$")
+    ax1.set_xlabel(r"Time $t$")
+    ax1.set_ylabel("MSD")
+    ax1.set_title(r"MSD slope %.3f ($\alpha=%g$)" % (data["msd_slope"], alpha))
+    ax1.legend(frameon=False)
+
+    # Reference power laws anchored at the geometric centre of the data.
+    x0, y0 = np.exp(np.mean(np.log(phi))), np.exp(np.mean(np.log(dt)))
+    ax2.loglog(phi, dt, "o", label="MC (fit %.3f)" % data["fit_slope"])
+    ax2.loglog(phi, y0 * (phi / x0) ** data["expected_slope"], "--", label=r"balance $-1/(1+2\alpha)$")
+    ax2.loglog(phi, y0 * (phi / x0) ** data["paper_slope"], ":", label=r"paper ansatz $-1/(2+\alpha)$")
+    ax2.set_xlabel(r"Photon flux $\Phi$")
+    ax2.set_ylabel(r"$\delta t_{\min}$")
+    ax2.set_title("Localization balance on CTRW trajectories")
+    ax2.legend(frameon=False)
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig13_ctrw_trajectory.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig13 saved:", figures_path("fig13_ctrw_trajectory.pdf"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+fig14_stopping_times.py — distinguishability stopping times vs Wald
+
+Depends on:
+- results/stopping_time_mc.json
+
+Shows:
+- Ramsey shots: mean stopping time (10–90% and 25–75% quantile bands)
+  vs phase offset, with the Wald approximation D* / KL
+- Poisson counts: the same vs rate ratio λ1/λ0 (in units of time)
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def _panel(ax, cases, xlabel, title):
+    keys = sorted(cases, key=float)
+    x = np.array([float(k) for k in keys])
+    mean = np.array([cases[k]["mean"] for k in keys])
+    wald = np.array([cases[k]["wald_mean"] for k in keys])
+    q = np.array([cases[k]["quantiles_10_25_50_75_90"] for k in keys])
+
+    ax.fill_between(x, q[:, 0], q[:, 4], alpha=0.2, label="10–90%")
+    ax.fill_between(x, q[:, 1], q[:, 3], alpha=0.3, label="25–75%")
+    ax.plot(x, q[:, 2], "s", ms=4, label="median")
+    ax.plot(x, mean, "o-", label="mean")
+    ax.plot(x, wald, "--", label=r"Wald $D^*/\mathrm{KL}$")
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xticks(x, [f"{v:g}" for v in x])
+    ax.xaxis.set_minor_locator(plt.NullLocator())
+    ax.set_xlabel(xlabel)
+    ax.set_title(title)
+    ax.legend(frameon=False, fontsize=8)
+
+
+def main():
+    data = load_json("stopping_time_mc.json")
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    ramsey = data["ramsey"]
+    _panel(ax1, ramsey["by_delta"], r"Phase offset $\Delta\varphi$", r"Ramsey shots ($V=%g$)" % ramsey["visibility"])
+    ax1.set_ylabel(r"Stopping time $\tau$ (shots)")
+
+    poisson = data["poisson"]
+    _panel(ax2, poisson["by_ratio"], r"Rate ratio $\lambda_1/\lambda_0$", r"Poisson counts ($\lambda_0=%g$)" % poisson["lam0"])
+    ax2.set_ylabel(r"Stopping time $\tau$ (time)")
+
+    fig.suptitle(r"First crossing of $D^*=%g$ (%d lanes)" % (data["D_star"], data["n_lanes"]))
+    fig.tight_layout()
+    fig.savefig(figures_path("fig14_stopping_times.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig14 saved:", figures_path("fig14_stopping_times.pdf"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+fig15_interferometer_estimator.py — finite-shot ML phase estimation vs CRB
+
+Depends on:
+- results/interferometer_estimator_mc.json
+
+Shows (middle visibility of the grid):
+- efficiency CRB / MSE of the ML estimator vs number of shots n, per φ:
+  exact binomial moments (lines) and Monte Carlo (markers)
+- |bias| vs n, exact (lines) and Monte Carlo (markers)
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("interferometer_estimator_mc.json")
+
+    phi = np.array(data["phi"], dtype=float)
+    n = np.array(data["shots"], dtype=float)
+    iv = len(data["visibility"]) // 2
+    V = data["visibility"][iv]
+    eff = np.array(data["efficiency"], dtype=float)[:, iv]
+    eff_exact = np.array(data["exact_efficiency"], dtype=float)[:, iv]
+    bias = np.abs(np.array(data["bias"], dtype=float)[:, iv])
+    bias_exact = np.abs(np.array(data["exact_bias"], dtype=float)[:, iv])
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    for i, p in enumerate(phi):
+        # φ and π - φ share efficiency and |bias|: mirror phases dashed.
+        ls, marker = ("-", "o") if p <= 0.5 * np.pi + 1e-12 else ("--", "x")
+        label = r"$\varphi=%.3g\pi$" % (p / np.pi)
+        line = ax1.plot(n, eff_exact[i], ls, label=label)[0]
+        ax1.plot(n, eff[i], marker, color=line.get_color(), ms=5)
+        if np.max(bias_exact[i]) > 1e-12:  # φ = π/2 is unbiased
+            ax2.plot(n, bias_exact[i], ls, color=line.get_color())
+            ax2.plot(n, bias[i], marker, color=line.get_color(), ms=5)
+
+    ax1.axhline(1.0, color="grey", lw=0.8)
+    ax1.set_xscale("log")
+    ax1.set_xlabel("Shots $n$")
+    ax1.set_ylabel("Efficiency CRB / MSE")
+    ax1.set_title(r"ML efficiency, $V=%g$ (lines exact, markers MC)" % V)
+    ax1.legend(frameon=False, fontsize=8)
+
+    ax2.set_xscale("log")
+    ax2.set_yscale("log")
+    ax2.set_xlabel("Shots $n$")
+    ax2.set_ylabel(r"$|\mathrm{bias}(\hat\varphi)|$")
+    ax2.set_title(r"Bias ($\varphi=\pi/2$ is unbiased)")
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig15_interferometer_estimator.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig15 saved:", figures_path("fig15_interferometer_estimator.pdf"))
+
+
+if __name__ == "__main__":
+    main()
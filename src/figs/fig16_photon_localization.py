@@ -0,0 +1,52 @@
+"""
+fig16_photon_localization.py — photon-by-photon localization: Φ^{-1/3}
+
+Depends on:
+- results/photon_localization_mc.json
+
+Shows:
+- SNR(w) of the window-variance motion signal for every Φ, with the
+  resolution threshold SNR = 1
+- δt_min(Φ) where SNR = 1, against the balance prediction and the
+  fitted exponent (expected -1/3)
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("photon_localization_mc.json")
+
+    phi = np.array(data["phi"], dtype=float)
+    dt = np.array(data["delta_t"], dtype=float)
+    pred = np.array(data["delta_t_pred"], dtype=float)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    for p, curve in zip(phi, data["curves"]):
+        ax1.loglog(curve["widths"], curve["snr"], "-", label=r"$\Phi=10^{%.3g}$" % np.log10(p))
+    ax1.axhline(1.0, color="grey", lw=0.8, ls="--")
+    ax1.set_xlabel(r"Window $w$")
+    ax1.set_ylabel(r"SNR$(w)$")
+    ax1.set_title("Window-variance motion signal")
+    ax1.legend(frameon=False, fontsize=8)
+
+    ax2.loglog(phi, dt, "o", label="MC (fit %.3f)" % data["fit_slope"])
+    ax2.loglog(phi, pred, "--", label="balance prediction")
+    ax2.set_xlabel(r"Photon flux $\Phi$")
+    ax2.set_ylabel(r"$\delta t_{\min}$ (SNR = 1)")
+    ax2.set_title(r"Expected slope $%.3f$" % data["expected_slope"])
+    ax2.legend(frameon=False)
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig16_photon_localization.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig16 saved:", figures_path("fig16_photon_localization.pdf"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+fig17_lindblad_noise_bound.py — exact Lindblad QFI vs the noise-suppression bound
+
+Depends on:
+- results/lindblad_noise_bound_mc.json
+
+Shows:
+- QFI at T against the bound ∫ 2t e^{-2Γ₂t} dt for every random channel
+  mix, coloured by the dominant channel, with the equality line
+- distribution of max_t QFI / bound per dominant channel (≤ 1)
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("lindblad_noise_bound_mc.json")
+
+    channels = data["channels"]
+    qfi = np.array(data["qfi_T"], dtype=float)
+    bound = np.array(data["bound_T"], dtype=float)
+    ratio = np.array(data["qfi_over_bound_max"], dtype=float)
+    dominant = np.argmax(np.array(data["rates"], dtype=float), axis=1)
+
+    # Upper edge includes round-off above 1 so no configuration drops out.
+    bins = np.linspace(ratio.min(), max(1.0, ratio.max()), 41)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    for j, name in enumerate(channels):
+        sel = dominant == j
+        ax1.loglog(bound[sel], qfi[sel], ".", ms=2, alpha=0.5, label=name.replace("_", " "))
+        ax2.hist(ratio[sel], bins=bins, histtype="step", label=name.replace("_", " "))
+    lim = np.array([bound.min(), bound.max()])
+    ax1.loglog(lim, lim, "k--", lw=0.8, label="QFI = bound")
+    ax1.set_xlabel(r"Bound $\int_0^T 2t\,e^{-2\Gamma_2 t}\,dt$")
+    ax1.set_ylabel(r"QFI at $T=%g$" % data["T"])
+    ax1.set_title("%d random channel mixes (colour: dominant)" % data["n_configs"])
+    ax1.legend(frameon=False, fontsize=8, markerscale=4)
+
+    ax2.axvline(1.0, color="k", lw=0.8, ls="--")
+    ax2.set_xlabel(r"$\max_t$ QFI / bound")
+    ax2.set_ylabel("Configurations")
+    ax2.set_title(
+        "max %.6f, violations %d (CFI > QFI: %d)"
+        % (data["max_qfi_over_bound"], data["violations_qfi_bound"], data["violations_cfi_le_qfi"])
+    )
+    ax2.legend(frameon=False, fontsize=8, loc="upper left")
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig17_lindblad_noise_bound.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig17 saved:", figures_path("fig17_lindblad_noise_bound.pdf"))
+
+
+if __name__ == "__main__":
+    main()
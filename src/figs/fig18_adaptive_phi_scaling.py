@@ -0,0 +1,65 @@
+"""
+fig18_adaptive_phi_scaling.py — adaptive Φ grid vs fixed grid exponents
+
+Depends on:
+- results/adaptive_phi_scaling.json
+
+Shows:
+- local exponents Δlog δt / Δlog Φ of the adaptive grid (±1σ) per model,
+  with the expected slopes and the detected asymptotic regime
+- slope bias against the expected exponent (±1σ), adaptive vs the fixed
+  8-point grid, with the evaluation budgets
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("adaptive_phi_scaling.json")
+    models = data["models"]
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    for i, (name, m) in enumerate(models.items()):
+        line = ax1.errorbar(
+            m["local_phi"], m["local_slope"], yerr=m["local_se"], fmt="o-", ms=4, capsize=3,
+            label="%s (%d points)" % (name, len(m["phi"])),
+        )
+        color = line[0].get_color()
+        ax1.axhline(m["expected_slope"], color=color, lw=0.8, ls="--")
+        ax1.axvline(m["regime_phi_min"], color=color, lw=0.8, ls=":")
+
+        x = np.array([i - 0.1, i + 0.1])
+        bias = [m["bias"], m["fixed_grid"]["bias"]]
+        se = [m["slope_se"], m["fixed_grid"]["slope_se"]]
+        ax2.errorbar(x[:1], bias[:1], yerr=se[:1], fmt="o", color=color, capsize=3,
+                     label="%s adaptive (%d evals)" % (name, m["n_evaluations"]))
+        ax2.errorbar(x[1:], bias[1:], yerr=se[1:], fmt="s", mfc="none", color=color, capsize=3,
+                     label="%s fixed grid (%d evals)" % (name, m["fixed_grid"]["n_evaluations"]))
+
+    ax1.set_xscale("log")
+    ax1.set_xlabel(r"Photon flux $\Phi$")
+    ax1.set_ylabel("Local exponent")
+    ax1.set_title("Local exponents (--: expected, ··: regime start)", fontsize=10)
+    ax1.legend(frameon=False, fontsize=8)
+
+    ax2.axhline(0.0, color="grey", lw=0.8)
+    ax2.set_xticks(range(len(models)), list(models))
+    ax2.set_xlim(-0.5, len(models) - 0.5)
+    ax2.set_ylabel("Fitted slope - expected")
+    ratios = ", ".join("%s %.3g" % (name, m["budget_ratio"]) for name, m in models.items())
+    ax2.set_title("Budget adaptive / fixed: %s" % ratios, fontsize=10)
+    ax2.legend(frameon=False, fontsize=8)
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig18_adaptive_phi_scaling.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig18 saved:", figures_path("fig18_adaptive_phi_scaling.pdf"))
+
+
+if __name__ == "__main__":
+    main()
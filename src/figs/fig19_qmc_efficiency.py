@@ -0,0 +1,59 @@
+"""
+fig19_qmc_efficiency.py — randomized QMC vs plain MC for E[log δt]
+
+Depends on:
+- results/qmc_efficiency_mc.json
+
+Shows:
+- replicate standard deviation vs sample size n at the middle Φ of the
+  grid, MC (solid) and scrambled Sobol QMC (dashed), with n^{-1/2}
+- ESS gain Var_MC / Var_QMC vs Φ at the largest n, per model
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.io_utils import figures_path, load_json
+
+
+def main():
+    data = load_json("qmc_efficiency_mc.json")
+
+    phi = np.array(data["phi"], dtype=float)
+    n = np.array(data["sizes"], dtype=float)
+    j = len(phi) // 2
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+
+    for name, m in data["models"].items():
+        sd_mc = np.array(m["sd_mc"], dtype=float)[:, j]
+        sd_qmc = np.array(m["sd_qmc"], dtype=float)[:, j]
+        line = ax1.loglog(n, sd_mc, "o-", label="%s MC (rate %.2f)" % (name, m["rate_mc"][j]))[0]
+        ax1.loglog(n, sd_qmc, "s--", color=line.get_color(), label="%s QMC (rate %.2f)" % (name, m["rate_qmc"][j]))
+
+        gain = np.array(m["ess_gain"], dtype=float)[-1]
+        ax2.loglog(phi, gain, "o-", color=line.get_color(), label=name)
+
+    ax1.loglog(n, sd_mc[0] * (n / n[0]) ** -0.5, ":", color="grey", label=r"$n^{-1/2}$")
+    ax1.set_xticks(n, [f"{v:g}" for v in n])
+    ax1.xaxis.set_minor_locator(plt.NullLocator())
+    ax1.set_xlabel("Samples per replicate $n$")
+    ax1.set_ylabel(r"SD of $\overline{\log\delta t}$ (%d replicates)" % data["n_rep"])
+    ax1.set_title(r"Convergence at $\Phi=%.3g$" % phi[j])
+    ax1.legend(frameon=False, fontsize=8)
+
+    ax2.axhline(1.0, color="grey", lw=0.8)
+    ax2.set_xlabel(r"Photon flux $\Phi$")
+    ax2.set_ylabel(r"ESS gain $\mathrm{Var}_{MC}/\mathrm{Var}_{QMC}$")
+    ax2.set_title("Equal-n variance ratio at $n=%d$" % n[-1])
+    ax2.legend(frameon=False)
+
+    fig.tight_layout()
+    fig.savefig(figures_path("fig19_qmc_efficiency.pdf"))
+    plt.close(fig)
+
+    print("[OK] fig19 saved:", figures_path("fig19_qmc_efficiency.pdf"))
+
+
+if __name__ == "__main__":
+    main()
@@ -26,8 +26,12 @@ def main():
         label=r"Dynamical scale $\delta\phi_{\mathrm{dyn}}$",
     )
 
-    idx = np.argmin(np.abs(np.log(delta_inf) - np.log(delta_dyn)))
-    ax.scatter([t[idx]], [delta_inf[idx]], s=40, label="Meeting point")
+    if "meeting_t" in data:
+        t_m, d_m = data["meeting_t"], data["meeting_delta"]
+    else:
+        idx = np.argmin(np.abs(np.log(delta_inf) - np.log(delta_dyn)))
+        t_m, d_m = t[idx], delta_inf[idx]
+    ax.scatter([t_m], [d_m], s=40, label="Meeting point")
 
     ax.set_xlabel(r"Interrogation time $t$")
     ax.set_ylabel(r"Phase scale")
@@ -29,8 +29,12 @@ def main():
     # Matplotlib mathtext does not know \geom; use \mathrm{geom}.
     ax.loglog(t, delta_dyn, lw=2, label=r"Geometric scale $\delta\phi_{\mathrm{geom}}$")
 
-    idx = np.argmin(np.abs(np.log(delta_inf) - np.log(delta_dyn)))
-    ax.scatter([t[idx]], [delta_inf[idx]], s=40, label="Meeting point")
+    if "meeting_t" in data:
+        t_m, d_m = data["meeting_t"], data["meeting_delta"]
+    else:
+        idx = np.argmin(np.abs(np.log(delta_inf) - np.log(delta_dyn)))
+        t_m, d_m = t[idx], delta_inf[idx]
+    ax.scatter([t_m], [d_m], s=40, label="Meeting point")
 
     ax.set_xlabel(r"Effective interrogation time")
     ax.set_ylabel(r"Phase scale")
@@ -13,20 +13,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from src.io_utils import figures_path
+from src.fisher.noise_bounds import fisher_upper_bound_cumulative
 
 
 def main():
     T = np.linspace(0, 10, 400)
     gamma_noise = 0.4
 
-    # Ideal Fisher rate (constant, normalized)
-    I_ideal = T
-
-    # Noise-suppressed bound
-    # NumPy 2.x: np.trapz was removed; use np.trapezoid (same intent).
-    I_noise = np.trapezoid(np.exp(-2 * gamma_noise * T[:, None]), T, axis=0)
-    # For plotting simplicity, show envelope
-    I_noise_env = (1 - np.exp(-2 * gamma_noise * T)) / (2 * gamma_noise)
+    # Ideal Fisher rate (constant, normalized): Γ = 0 and Γ > 0 in one call
+    I_ideal, I_noise_env = fisher_upper_bound_cumulative(1.0, T, [0.0, gamma_noise])
 
     fig, ax = plt.subplots(figsize=(6, 4))
 
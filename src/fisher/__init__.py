@@ -7,6 +7,10 @@ This subpackage contains closed-form expressions and bounds for:
 - Mach–Zehnder interferometry
 - Ornstein–Uhlenbeck processes
 - Noise suppression bounds
+- Quantum Fisher information (batched SLD QFI / QFI matrices, qubit Bloch fast path)
+- Batched Lindblad evolution with exact classical Fisher / QFI along trajectories
+- Multi-parameter Fisher information matrices and distinguishability ellipsoids
+- Shared numerical backends (two-outcome kernel, adaptive quadrature)
 
 No simulations live here.
 """
@@ -10,7 +10,8 @@ Probabilities:
     p_±(φ) = (1 ± V cos φ) / 2
 
 This is formally identical to Ramsey interferometry, but interpreted
-as a spatial / optical interferometer with losses.
+as a spatial / optical interferometer with losses. Both share the
+broadcasting kernel in `two_outcome.py`.
 """
 
 from __future__ import annotations
@@ -18,56 +19,55 @@ from __future__ import annotations
 import numpy as np
 from typing import Tuple
 
+from .two_outcome import FisherSurface, _float_dtype, fisher_surface, two_outcome_fisher, two_outcome_probabilities
 
-def mzi_probabilities(phi: float, visibility: float = 1.0) -> Tuple[float, float]:
+
+def mzi_probabilities(phi, visibility=1.0) -> Tuple[np.ndarray, np.ndarray]:
     """
     Mach–Zehnder output probabilities.
 
     Parameters
     ----------
-    phi : float
+    phi : array_like
         Phase difference.
-    visibility : float
+    visibility : array_like
         Effective visibility V ∈ (0, 1].
 
     Returns
     -------
     (p_plus, p_minus)
     """
-    p_plus = 0.5 * (1.0 + visibility * np.cos(phi))
-    p_minus = 1.0 - p_plus
-    return p_plus, p_minus
+    p_plus, p_minus = two_outcome_probabilities(phi, visibility)
+    return p_plus[()], p_minus[()]
 
 
-def mzi_fisher(phi: float, visibility: float = 1.0) -> float:
+def mzi_fisher(phi, visibility=1.0) -> np.ndarray:
     """
     Classical Fisher information for Mach–Zehnder interferometry.
 
     Parameters
     ----------
-    phi : float
+    phi : array_like
         Phase.
-    visibility : float
+    visibility : array_like
         Visibility V ∈ (0, 1].
 
     Returns
     -------
-    float
-        Fisher information I(φ).
+    np.ndarray
+        Fisher information I(φ) on the broadcast grid.
     """
-    p_plus, p_minus = mzi_probabilities(phi, visibility)
-
-    eps = 1e-15
-    p_plus = np.clip(p_plus, eps, 1.0 - eps)
-    p_minus = np.clip(p_minus, eps, 1.0 - eps)
+    return two_outcome_fisher(phi, visibility)[()]
 
-    dp_dphi = -0.5 * visibility * np.sin(phi)
 
-    fisher = (dp_dphi ** 2) * (1.0 / p_plus + 1.0 / p_minus)
-    return float(fisher)
+def mzi_fisher_surface(phi, visibility=1.0) -> FisherSurface:
+    """
+    Full Fisher surface over (φ, V) plus its argmax operating point.
+    """
+    return fisher_surface(phi, visibility)
 
 
-def mzi_fisher_max(visibility: float = 1.0) -> float:
+def mzi_fisher_max(visibility=1.0) -> np.ndarray:
     """
     Maximum Fisher information over φ.
 
@@ -75,7 +75,7 @@ def mzi_fisher_max(visibility: float = 1.0) -> float:
 
     Returns
     -------
-    float
+    np.ndarray
         I_max = V^2.
     """
-    return float(visibility ** 2)
+    return (np.asarray(visibility, dtype=_float_dtype(visibility)) ** 2)[()]
@@ -8,6 +8,9 @@ Model:
 
 Probabilities:
     p_± = (1 ± V cos φ) / 2
+
+All functions broadcast over arrays of φ, V, γ and t (shared kernel in
+`two_outcome.py`); scalar inputs give NumPy scalars.
 """
 
 from __future__ import annotations
@@ -15,57 +18,59 @@ from __future__ import annotations
 import numpy as np
 from typing import Tuple
 
+from .two_outcome import FisherSurface, _float_dtype, fisher_surface, two_outcome_fisher, two_outcome_probabilities
+
 
-def ramsey_probabilities(phi: float, visibility: float = 1.0) -> Tuple[float, float]:
+def ramsey_probabilities(phi, visibility=1.0, gamma=0.0, t=0.0) -> Tuple[np.ndarray, np.ndarray]:
     """
     Ramsey outcome probabilities.
 
     Parameters
     ----------
-    phi : float
+    phi : array_like
         Phase.
-    visibility : float
+    visibility : array_like
         Visibility V ∈ (0, 1].
+    gamma, t : array_like
+        Optional dephasing rate and time, V → V exp(-γ t).
 
     Returns
     -------
     (p_plus, p_minus)
     """
-    p_plus = 0.5 * (1.0 + visibility * np.cos(phi))
-    p_minus = 1.0 - p_plus
-    return p_plus, p_minus
+    p_plus, p_minus = two_outcome_probabilities(phi, visibility, gamma, t)
+    return p_plus[()], p_minus[()]
 
 
-def ramsey_fisher(phi: float, visibility: float = 1.0) -> float:
+def ramsey_fisher(phi, visibility=1.0, gamma=0.0, t=0.0) -> np.ndarray:
     """
     Classical Fisher information for Ramsey interferometry.
 
     Parameters
     ----------
-    phi : float
+    phi : array_like
         Phase.
-    visibility : float
+    visibility : array_like
         Visibility V ∈ (0, 1].
+    gamma, t : array_like
+        Optional dephasing rate and time, V → V exp(-γ t).
 
     Returns
     -------
-    float
-        Fisher information I(φ).
+    np.ndarray
+        Fisher information I(φ) on the broadcast grid.
     """
-    p_plus, p_minus = ramsey_probabilities(phi, visibility)
-
-    # Avoid numerical issues near boundaries
-    eps = 1e-15
-    p_plus = np.clip(p_plus, eps, 1.0 - eps)
-    p_minus = np.clip(p_minus, eps, 1.0 - eps)
+    return two_outcome_fisher(phi, visibility, gamma, t)[()]
 
-    dp_dphi = -0.5 * visibility * np.sin(phi)
 
-    fisher = (dp_dphi ** 2) * (1.0 / p_plus + 1.0 / p_minus)
-    return float(fisher)
+def ramsey_fisher_surface(phi, visibility=1.0, gamma=0.0, t=0.0) -> FisherSurface:
+    """
+    Full Fisher surface over (φ, V, γ, t) plus its argmax operating point.
+    """
+    return fisher_surface(phi, visibility, gamma, t)
 
 
-def ramsey_fisher_max(visibility: float = 1.0) -> float:
+def ramsey_fisher_max(visibility=1.0) -> np.ndarray:
     """
     Maximum Fisher information over φ.
 
@@ -73,7 +78,7 @@ def ramsey_fisher_max(visibility: float = 1.0) -> float:
 
     Returns
     -------
-    float
+    np.ndarray
         I_max = V^2.
     """
-    return float(visibility ** 2)
+    return (np.asarray(visibility, dtype=_float_dtype(visibility)) ** 2)[()]
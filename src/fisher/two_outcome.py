@@ -0,0 +1,150 @@
+"""
+two_outcome.py — shared Fisher kernel for two-outcome interferometers
+
+Ramsey and Mach–Zehnder interferometry share the same statistics:
+
+    p_±(φ) = (1 ± V cos φ) / 2,      V = V_0 exp(-Γ t)
+
+so their classical Fisher information is
+
+    I(φ) = (∂_φ p_+)^2 (1/p_+ + 1/p_-) = V² sin² φ / (1 - V² cos² φ).
+
+All functions here broadcast over arbitrary arrays of φ, V_0, Γ and t
+and preserve the floating dtype of the inputs (float32 stays float32).
+`ramsey_fisher.py` and `mzi_fisher.py` are thin wrappers over this kernel.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+# Boundary clip for p_± in the float64 Fisher helpers (fisher_matrix, qfi).
+EPS = 1e-15
+
+
+def _float_dtype(*arrays) -> np.dtype:
+    """Common floating dtype of the array inputs (Python scalars -> float64)."""
+    dtypes = [a.dtype for a in arrays if isinstance(a, (np.ndarray, np.generic))]
+    if not dtypes:
+        return np.dtype(float)
+    dtype = np.result_type(*dtypes)
+    if not np.issubdtype(dtype, np.floating):
+        dtype = np.result_type(dtype, np.float64)
+    return dtype
+
+
+def effective_visibility(visibility=1.0, gamma=0.0, t=0.0) -> np.ndarray:
+    """
+    Dephased visibility V = V_0 exp(-Γ t), broadcast over all inputs.
+
+    Parameters
+    ----------
+    visibility : array_like
+        Bare visibility V_0 ∈ (0, 1].
+    gamma : array_like
+        Dephasing rate Γ ≥ 0.
+    t : array_like
+        Dephasing (interrogation) time.
+
+    Returns
+    -------
+    np.ndarray
+        Effective visibility.
+    """
+    dtype = _float_dtype(visibility, gamma, t)
+    V0 = np.asarray(visibility, dtype=dtype)
+    gamma = np.asarray(gamma, dtype=dtype)
+    t = np.asarray(t, dtype=dtype)
+    if not np.any(gamma):
+        return np.broadcast_to(V0, np.broadcast_shapes(V0.shape, gamma.shape, t.shape))
+    return V0 * np.exp(-gamma * t)
+
+
+def two_outcome_probabilities(phi, visibility=1.0, gamma=0.0, t=0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Outcome probabilities p_± = (1 ± V cos φ) / 2 on the broadcast grid.
+
+    Returns
+    -------
+    (p_plus, p_minus)
+    """
+    dtype = _float_dtype(phi, visibility, gamma, t)
+    phi = np.asarray(phi, dtype=dtype)
+    V = effective_visibility(visibility, gamma, t).astype(dtype, copy=False)
+
+    p_plus = 0.5 * (1.0 + V * np.cos(phi))
+    p_minus = 1.0 - p_plus
+    return p_plus, p_minus
+
+
+def two_outcome_fisher(phi, visibility=1.0, gamma=0.0, t=0.0) -> np.ndarray:
+    """
+    Classical Fisher information I(φ) on the broadcast grid.
+
+    Parameters
+    ----------
+    phi : array_like
+        Phase(s).
+    visibility : array_like
+        Bare visibility V_0 ∈ (0, 1].
+    gamma, t : array_like
+        Optional dephasing rate and time (V = V_0 e^{-Γt}).
+
+    Returns
+    -------
+    np.ndarray
+        Fisher information with the broadcast shape of the inputs.
+    """
+    dtype = _float_dtype(phi, visibility, gamma, t)
+    phi = np.asarray(phi, dtype=dtype)
+    V = effective_visibility(visibility, gamma, t).astype(dtype, copy=False)
+
+    # Closed form with 1 - V² cos² φ = (1 - V²) + V² sin² φ: no p_± clip,
+    # so the φ → 0, V → 1 limit stays exact in any dtype (float32 p_- underflows).
+    V2 = V * V
+    num = V2 * np.sin(phi) ** 2
+    den = (1.0 - V2) + num
+    return np.divide(num, den, out=np.zeros_like(num), where=den != 0)
+
+
+@dataclass(frozen=True)
+class FisherSurface:
+    """Fisher surface on a broadcast grid plus its argmax operating point."""
+
+    fisher: np.ndarray
+    argmax: Tuple[int, ...]
+    phi_opt: float
+    visibility_opt: float
+    fisher_max: float
+
+
+def fisher_surface(phi, visibility=1.0, gamma=0.0, t=0.0) -> FisherSurface:
+    """
+    Evaluate I(φ, V, Γ, t) on the full broadcast grid and locate its maximum.
+
+    Typical use is an open mesh, e.g.
+        fisher_surface(phi[:, None], visibility[None, :])
+    which returns a (n_phi, n_V) surface without materializing the mesh.
+
+    Returns
+    -------
+    FisherSurface
+        `fisher` surface, multi-index `argmax` into it, and the operating
+        point (φ, effective V) at which the maximum is reached.
+    """
+    fisher = two_outcome_fisher(phi, visibility, gamma, t)
+    idx = np.unravel_index(int(np.argmax(fisher)), fisher.shape)
+
+    phi_b = np.broadcast_to(np.asarray(phi), fisher.shape)
+    V_b = np.broadcast_to(effective_visibility(visibility, gamma, t), fisher.shape)
+
+    return FisherSurface(
+        fisher=fisher,
+        argmax=tuple(int(i) for i in idx),
+        phi_opt=float(phi_b[idx]),
+        visibility_opt=float(V_b[idx]),
+        fisher_max=float(fisher[idx]),
+    )
@@ -3,7 +3,7 @@ io_utils.py — minimal I/O helpers
 
 Purpose:
 - Centralize reading/writing of results.
-- Keep formats simple and explicit (json / npz).
+- Keep formats simple and explicit (json / npz / npy memmaps).
 - Avoid ad-hoc file handling in simulations and figures.
 """
 
@@ -60,3 +60,16 @@ def load_npz(filename: str) -> Dict[str, np.ndarray]:
     path = results_path(filename)
     with np.load(path) as data:
         return dict(data)
+
+
+def open_memmap(filename: str, shape=None, dtype=np.float32, mode: str = "w+") -> np.memmap:
+    """
+    Memory-mapped .npy array in results/ (for ensembles larger than RAM).
+
+    mode="w+" creates the file with `shape`/`dtype`; "r" / "r+" open an
+    existing one.
+    """
+    path = results_path(filename)
+    if mode == "w+":
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+    return np.load(path, mmap_mode=mode)
@@ -0,0 +1,375 @@
+"""
+kernels.py — per-lane Monte Carlo kernels: optional Numba backend, NumPy fallback
+
+Some hot loops give every lane its own, data-dependent amount of work
+(fixed-point iterations with per-lane stopping, CTRW epochs crossing the
+observation grid), which NumPy can only express as whole-array passes
+over masks. Each kernel here exists twice:
+
+    numpy   whole-array passes over the active lanes;
+    numba   an explicit per-lane loop, `numba.njit(parallel=True,
+            cache=True)` over lanes (compiled once, cached on disk in
+            __pycache__, so later runs start without recompiling).
+
+Callers: `balance_fixed_point` runs every δt sample of
+`diffusion_localization_mc` (mc, qmc and control-variate paths, all
+inverse-CDF from pre-drawn uniforms); `ctrw_advance` every block of
+`ctrw_trajectory_mc`. The balance loop is bound by the scipy `pdtr`
+calls both backends make per lane and step, so Numba gains there only
+come from cores (prange); `ctrw_advance` is ~10x faster compiled.
+`stopping_time_mc` is not covered: its increments come from pluggable
+model callbacks that draw inside the loop, and its block-wise
+active-set compaction already keeps the work proportional to the
+surviving lanes.
+
+Both consume the SAME pre-drawn random numbers (uniforms, waiting times,
+jumps) — no random draws happen inside a kernel — and perform the same
+floating-point operations in the same order (the Poisson inverse CDF
+calls scipy's own C `pdtr` / `ndtri`), so their outputs are bit-identical.
+`check_backends` (CLI: `python -m src.kernels`, non-zero exit on any
+mismatch) verifies this on random inputs and times both. Without Numba
+the loop kernels still run, as plain Python on small inputs, so the
+comparison is never skipped.
+
+Backend: `backend=` per call, else `RUNTIME.kernels` (env DRT_KERNELS:
+auto | numba | numpy); "auto" uses Numba when it is installed.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import math
+import time
+from functools import lru_cache
+
+import numpy as np
+from scipy.special import cython_special, ndtri, pdtr
+
+from src.config import RUNTIME
+from src.poisson_sampling import poisson_ppf
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+
+HAVE_NUMBA = numba is not None
+KERNEL_BACKENDS = ("auto", "numba", "numpy")
+
+_TINY = float(np.finfo(float).tiny)
+_ONE_MINUS = 1.0 - float(np.finfo(float).epsneg)
+
+if HAVE_NUMBA:
+    _jit = numba.njit(cache=True)
+    _jit_parallel = numba.njit(cache=True, parallel=True)
+    prange = numba.prange
+else:
+    _jit = _jit_parallel = lambda fn: fn
+    prange = range
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """Concrete backend ("numba" or "numpy") for a request."""
+    backend = RUNTIME.kernels if backend is None else backend
+    if backend not in KERNEL_BACKENDS:
+        raise ValueError(f"backend must be one of {KERNEL_BACKENDS}")
+    if backend == "numba" and not HAVE_NUMBA:
+        raise ImportError("numba is not installed (use backend='auto' or 'numpy')")
+    if backend == "auto":
+        return "numba" if HAVE_NUMBA else "numpy"
+    return backend
+
+
+# ---------------------------------------------------------------------------
+# Scalar helpers (Numba-compatible Python)
+# ---------------------------------------------------------------------------
+
+
+def _special(name: str, n_args: int):
+    """
+    The C routine behind scipy.special.<name> (`cython_special` capsule) as a
+    ctypes function, callable from Python and from Numba's nopython mode.
+    It is the same code as the ufunc, so the loop kernels reproduce
+    `poisson_ppf` bit for bit. cpdef exports take a trailing skip-dispatch int.
+    Kernels receive these as arguments: a ctypes global would be frozen into
+    the machine code as an address and disable Numba's on-disk cache.
+    """
+    capsule = cython_special.__pyx_capi__[name]
+    get_name = ctypes.pythonapi.PyCapsule_GetName
+    get_name.restype, get_name.argtypes = ctypes.c_char_p, [ctypes.py_object]
+    get_pointer = ctypes.pythonapi.PyCapsule_GetPointer
+    get_pointer.restype, get_pointer.argtypes = ctypes.c_void_p, [ctypes.py_object, ctypes.c_char_p]
+    signature = ctypes.CFUNCTYPE(ctypes.c_double, *([ctypes.c_double] * n_args), ctypes.c_int)
+    return signature(get_pointer(capsule, get_name(capsule)))
+
+
+@lru_cache(maxsize=None)
+def _special_functions():
+    """
+    (pdtr, ndtri) for the loop kernels, built on first use: the capsule
+    routines when the loops are compiled by Numba, the scipy ufuncs (same
+    C code) when they run as plain Python, so the private capsule ABI is
+    only touched on the Numba backend.
+    """
+    if HAVE_NUMBA:
+        return _special("pdtr", 2), _special("ndtri", 1)
+    return (lambda k, lam, _: pdtr(k, lam)), (lambda u, _: ndtri(u))
+
+
+@_jit
+def _poisson_quantile(u, lam, pdtr, ndtri):
+    """Scalar `poisson_ppf`: Cornish–Fisher guess, then exact `pdtr` steps."""
+    u = min(max(u, _TINY), _ONE_MINUS)
+    z = ndtri(u, 0)
+    k = max(np.floor(lam + np.sqrt(lam) * z + (z * z - 1.0) / 6.0), 0.0)
+    while pdtr(k, lam, 0) < u:
+        k += 1.0
+    while k > 0.0 and pdtr(k - 1.0, lam, 0) >= u:
+        k -= 1.0
+    return k
+
+
+# ---------------------------------------------------------------------------
+# Localization balance fixed point (diffusion_localization_mc)
+# ---------------------------------------------------------------------------
+
+
+@_jit_parallel
+def _balance_loop(phi, u, s2, two_d, delta0, tol, out, pdtr, ndtri):
+    n_iter, n_phi, n_mc = u.shape
+    for lane in prange(n_phi * n_mc):
+        i = lane // n_mc
+        j = lane - i * n_mc
+        dt = delta0
+        for k in range(n_iter):
+            n = max(_poisson_quantile(u[k, i, j], phi[i] * dt, pdtr, ndtri), 1.0)
+            new = max(s2 / (two_d * math.sqrt(n)), 1e-12)
+            done = tol >= 0.0 and abs(new - dt) <= tol * dt
+            dt = new
+            if done:
+                break
+        out[i, j] = dt
+    return out
+
+
+def _balance_numpy(phi, u, s2, two_d, delta0, tol):
+    phi = phi[:, None]
+    delta_t = np.full(u.shape[1:], delta0)
+    active = np.ones(delta_t.shape, dtype=bool) if tol >= 0.0 else None
+    for k in range(u.shape[0]):
+        if active is None:
+            N = poisson_ppf(u[k], phi * delta_t, min_count=1)
+            delta_t = np.maximum(s2 / (two_d * np.sqrt(N.astype(float))), 1e-12)
+            continue
+        if not active.any():
+            break
+        rows, cols = np.nonzero(active)
+        old = delta_t[rows, cols]
+        N = poisson_ppf(u[k, rows, cols], phi[rows, 0] * old, min_count=1)
+        new = np.maximum(s2 / (two_d * np.sqrt(N.astype(float))), 1e-12)
+        delta_t[rows, cols] = new
+        active[rows, cols] = ~(np.abs(new - old) <= tol * old)
+    return delta_t
+
+
+def balance_fixed_point(
+    phi_values,
+    u,
+    D: float = 1.0,
+    sigma_m: float = 1.0,
+    delta0: float = 1e-2,
+    tol: float | None = None,
+    backend: str | None = None,
+) -> np.ndarray:
+    """
+    Per-lane balance iteration δt ← σ_m² / (2 D √N), N = F⁻¹(u_k; Φ δt) ≥ 1.
+
+    Parameters
+    ----------
+    phi_values : array_like
+        Φ, shape (n_phi,).
+    u : array_like
+        Pre-drawn uniforms, shape (n_iter, n_phi, n_mc); step k of a lane
+        consumes u[k] (the inverse-CDF draw of `diffusion_localization_mc`).
+    delta0 : float
+        Starting δt of every lane.
+    tol : float, optional
+        Per-lane stopping rule: a lane stops once |Δδt| ≤ tol · δt. None
+        runs all n_iter steps (the sims' fixed 10-step iteration).
+    backend : {"auto", "numba", "numpy"}, optional
+
+    Returns
+    -------
+    np.ndarray
+        δt of shape (n_phi, n_mc).
+    """
+    phi = np.ascontiguousarray(phi_values, dtype=float)
+    u = np.ascontiguousarray(u, dtype=float)
+    s2, two_d = sigma_m**2, 2.0 * D
+    tol = -1.0 if tol is None else float(tol)
+    return _balance(phi, u, s2, two_d, float(delta0), tol, resolve_backend(backend) == "numba")
+
+
+def _balance(phi, u, s2, two_d, delta0, tol, loop):
+    if loop:
+        return _balance_loop(phi, u, s2, two_d, delta0, tol, np.empty(u.shape[1:]), *_special_functions())
+    return _balance_numpy(phi, u, s2, two_d, delta0, tol)
+
+
+# ---------------------------------------------------------------------------
+# CTRW epochs on the observation grid (ctrw_trajectory_mc)
+# ---------------------------------------------------------------------------
+
+
+@_jit_parallel
+def _ctrw_advance_loop(epoch, pos, waits, steps, t_obs, rows, epoch_out, pos_out):
+    b, m = waits.shape
+    n_obs = t_obs.size
+    t_max = t_obs[n_obs - 1]
+    cap = t_max + 1.0
+    span = t_max + 2.0
+    for r in prange(b):
+        off = r * span
+        ep = np.empty(m)
+        xs = np.empty(m)
+        cw = 0.0
+        cx = 0.0
+        for k in range(m):
+            cw += waits[r, k]
+            cx += steps[r, k]
+            ep[k] = epoch[r] + cw
+            xs[k] = pos[r] + cx
+        count = 0
+        for j in range(n_obs):
+            q = t_obs[j] + off
+            while count < m and min(ep[count], cap) + off <= q:
+                count += 1
+            if t_obs[j] >= epoch[r]:
+                rows[r, j] = xs[count - 1] if count > 0 else pos[r]
+        epoch_out[r] = ep[m - 1]
+        pos_out[r] = xs[m - 1]
+
+
+def _ctrw_advance_numpy(epoch, pos, waits, steps, t_obs, rows):
+    b, m = waits.shape
+    n_obs = t_obs.size
+    t_max = float(t_obs[-1])
+    span = t_max + 2.0
+    ep = epoch[:, None] + np.cumsum(waits, axis=1)
+    xs = pos[:, None] + np.cumsum(steps, axis=1)
+
+    # Row-wise searchsorted: clip epochs past the grid, offset each row.
+    offs = np.arange(b)[:, None] * span
+    flat = (np.minimum(ep, t_max + 1.0) + offs).ravel()
+    idx = np.searchsorted(flat, (t_obs[None, :] + offs).ravel(), side="right").reshape(b, n_obs)
+    count = idx - np.arange(b)[:, None] * m
+
+    x_at = np.where(count > 0, np.take_along_axis(xs, np.maximum(count - 1, 0), axis=1), pos[:, None])
+    fresh = t_obs[None, :] >= epoch[:, None]
+    rows[fresh] = x_at[fresh]
+    return ep[:, -1].copy(), xs[:, -1].copy()
+
+
+def ctrw_advance(epoch, pos, waits, steps, t_obs, rows, backend: str | None = None):
+    """
+    Advance a batch of CTRW walkers by one block of pre-drawn jumps.
+
+    Walker r starts at (epoch[r], pos[r]) and makes the jumps steps[r]
+    after the waiting times waits[r]; every grid time t_obs[j] ≥ epoch[r]
+    gets the position held at that time, written into rows[r, j] in place.
+
+    Returns
+    -------
+    (epoch, pos)
+        Epoch and position after the last jump of the block, shape (b,).
+    """
+    epoch = np.ascontiguousarray(epoch, dtype=float)
+    pos = np.ascontiguousarray(pos, dtype=float)
+    waits = np.ascontiguousarray(waits, dtype=float)
+    steps = np.ascontiguousarray(steps, dtype=float)
+    t_obs = np.ascontiguousarray(t_obs, dtype=float)
+    return _ctrw(epoch, pos, waits, steps, t_obs, rows, resolve_backend(backend) == "numba")
+
+
+def _ctrw(epoch, pos, waits, steps, t_obs, rows, loop):
+    if loop:
+        epoch_out, pos_out = np.empty_like(epoch), np.empty_like(pos)
+        _ctrw_advance_loop(epoch, pos, waits, steps, t_obs, rows, epoch_out, pos_out)
+        return epoch_out, pos_out
+    return _ctrw_advance_numpy(epoch, pos, waits, steps, t_obs, rows)
+
+
+# ---------------------------------------------------------------------------
+# Backend check / bench
+# ---------------------------------------------------------------------------
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def check_backends(seed: int = 0, n_mc: int | None = None, n_walkers: int | None = None) -> dict:
+    """
+    Run every kernel through its NumPy and its loop implementation with the
+    same pre-drawn inputs.
+
+    The loop implementation is the Numba kernel when Numba is installed
+    and otherwise the same function run as plain Python; n_mc and
+    n_walkers then default to 64 instead of 4096 to keep that affordable.
+
+    Returns
+    -------
+    dict
+        Per kernel: "equal" (bit-identical outputs), "mismatches" and the
+        wall time of each implementation (for Numba, of a second call,
+        after compilation).
+    """
+    small = not HAVE_NUMBA
+    n_mc = (64 if small else 4096) if n_mc is None else int(n_mc)
+    n_walkers = (64 if small else 4096) if n_walkers is None else int(n_walkers)
+    rng = np.random.default_rng(seed)
+    phi = np.logspace(0, 5, 12)
+    u = rng.random((10, phi.size, n_mc))
+    t_obs = np.logspace(-2, 2, 60)
+    epoch = rng.random(n_walkers)
+    pos = rng.standard_normal(n_walkers)
+    waits = -np.log(rng.random((n_walkers, 64)))
+    steps = rng.standard_normal((n_walkers, 64))
+
+    cases = {
+        "balance_fixed_point": lambda loop: (_balance(phi, u, 1.0, 2.0, 1e-2, -1.0, loop),),
+        "balance_fixed_point(tol)": lambda loop: (_balance(phi, u, 1.0, 2.0, 1e-2, 1e-3, loop),),
+        "ctrw_advance": lambda loop: _ctrw_case(epoch, pos, waits, steps, t_obs, loop),
+    }
+    report = {}
+    for name, case in cases.items():
+        ref, t_np = _timed(lambda: case(False))
+        if HAVE_NUMBA:
+            case(True)
+        out, t_loop = _timed(lambda: case(True))
+        diff = np.concatenate([np.ravel(a != b) for a, b in zip(ref, out)])
+        report[name] = {"numpy_s": t_np, "loop_s": t_loop, "equal": not diff.any(), "mismatches": int(diff.sum())}
+    return report
+
+
+def _ctrw_case(epoch, pos, waits, steps, t_obs, loop):
+    rows = np.zeros((epoch.size, t_obs.size))
+    epoch_out, pos_out = _ctrw(epoch, pos, waits, steps, t_obs, rows, loop)
+    return rows, epoch_out, pos_out
+
+
+def main():
+    print(f"numba: {numba.__version__ if HAVE_NUMBA else 'not installed (loops checked as plain Python, small inputs)'}")
+    loop_name = "numba" if HAVE_NUMBA else "python"
+    failed = False
+    for name, row in check_backends().items():
+        status = "bit-identical" if row["equal"] else f"{row['mismatches']} MISMATCHES"
+        failed |= not row["equal"]
+        print(f"{name:26s} numpy {row['numpy_s']:8.4f}s  {loop_name} {row['loop_s']:8.4f}s  {status}")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
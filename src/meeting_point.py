@@ -0,0 +1,424 @@
+"""
+meeting_point.py — vectorized meeting-point solver
+
+The meeting point t_m separates inference-limited from dynamics-limited
+regimes:
+
+    δ_inf(t_m; params) = δ_dyn(t_m; params).
+
+`solve_meeting_point` finds t_m for whole grids of parameters at once by
+bracketed Illinois (modified regula falsi) iteration on
+h(u) = log δ_inf(e^u) - log δ_dyn(e^u), on a compacted set of unfinished
+lanes, until every bracket is a few ulps wide (machine precision in
+log t). Lanes without a sign change on the bracket, or still open after
+max_iter steps, are reported as not converged (NaN). h is evaluated in
+log form for the standard scales, so e^{-2Γt} cannot underflow at large
+t; infinite end values still count by their sign.
+
+Standard scales shared by the Ramsey and MZI analyses:
+    δ_inf(t) = sqrt(2 D* / (t · I_max)),   I_max = V² e^{-2Γt}
+    δ_dyn(t) = 1 / t
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+ScaleFn = Callable[..., np.ndarray]
+
+
+def delta_inf_interferometer(t, visibility=1.0, D_star=1.0, gamma=0.0) -> np.ndarray:
+    """Inference-limited phase scale sqrt(2 D* / (t V² e^{-2Γt}))."""
+    t = np.asarray(t, dtype=float)
+    I_t = t * np.asarray(visibility, dtype=float) ** 2 * np.exp(-2.0 * np.asarray(gamma, dtype=float) * t)
+    return np.sqrt(2.0 * np.asarray(D_star, dtype=float) / I_t)
+
+
+def delta_dyn_inverse_time(t, **_) -> np.ndarray:
+    """Dynamical / geometric phase scale 1/t."""
+    return 1.0 / np.asarray(t, dtype=float)
+
+
+def log_delta_inf_interferometer(t, visibility=1.0, D_star=1.0, gamma=0.0) -> np.ndarray:
+    """log δ_inf = ½ log(2 D*) - ½ log t - log V + Γt (no underflow of e^{-2Γt})."""
+    t = np.asarray(t, dtype=float)
+    with np.errstate(divide="ignore"):
+        return (
+            0.5 * np.log(2.0 * np.asarray(D_star, dtype=float))
+            - 0.5 * np.log(t)
+            - np.log(np.asarray(visibility, dtype=float))
+            + np.asarray(gamma, dtype=float) * t
+        )
+
+
+def log_delta_dyn_inverse_time(t, **_) -> np.ndarray:
+    """log δ_dyn = -log t."""
+    return -np.log(np.asarray(t, dtype=float))
+
+
+_LOG_FORMS: Dict[Callable, Callable] = {
+    delta_inf_interferometer: log_delta_inf_interferometer,
+    delta_dyn_inverse_time: log_delta_dyn_inverse_time,
+}
+
+
+def _log_scale(fn: ScaleFn) -> ScaleFn:
+    """log of a scale function: closed log form if known, else log(fn)."""
+    if fn in _LOG_FORMS:
+        return _LOG_FORMS[fn]
+    return lambda t, **p: np.log(fn(t, **p))
+
+
+def meeting_curves(
+    times,
+    delta_inf: ScaleFn = delta_inf_interferometer,
+    delta_dyn: ScaleFn = delta_dyn_inverse_time,
+    **params,
+):
+    """Both scales on a time grid (broadcast against the parameters)."""
+    times = np.asarray(times, dtype=float)
+    return np.asarray(delta_inf(times, **params)), np.asarray(delta_dyn(times, **params))
+
+
+@dataclass(frozen=True)
+class MeetingPoint:
+    """Meeting time, common scale and convergence flag on the parameter grid."""
+
+    t: np.ndarray
+    delta: np.ndarray
+    converged: np.ndarray
+
+
+def solve_meeting_point(
+    delta_inf: ScaleFn = delta_inf_interferometer,
+    delta_dyn: ScaleFn = delta_dyn_inverse_time,
+    t_lo: float = 1e-6,
+    t_hi: float = 1e6,
+    max_iter: int = 200,
+    **params,
+) -> MeetingPoint:
+    """
+    Solve δ_inf(t; params) = δ_dyn(t; params) over broadcast parameter grids.
+
+    Parameters
+    ----------
+    delta_inf, delta_dyn : callable
+        Scales f(t, **params); must broadcast t against the parameters.
+    t_lo, t_hi : float or array_like
+        Bracket in t (> 0), broadcast against the parameters.
+    max_iter : int
+        Safety cap on Illinois steps.
+    **params : array_like
+        Parameter grids (e.g. visibility=V[:, None], D_star=D[None, :]).
+
+    Returns
+    -------
+    MeetingPoint
+        Arrays shaped like the broadcast parameters.
+    """
+    arrays = [np.asarray(v, dtype=float) for v in params.values()]
+    shape = np.broadcast_shapes(np.shape(t_lo), np.shape(t_hi), *(a.shape for a in arrays))
+    flat = {k: np.broadcast_to(a, shape).ravel() for k, a in zip(params, arrays)}
+
+    log_inf, log_dyn = _log_scale(delta_inf), _log_scale(delta_dyn)
+
+    def h(u, idx):
+        t = np.exp(u)
+        sub = {k: v[idx] for k, v in flat.items()}
+        return log_inf(t, **sub) - log_dyn(t, **sub)
+
+    n = int(np.prod(shape, dtype=int))
+    everything = np.arange(n)
+    lo = np.broadcast_to(np.log(np.asarray(t_lo, dtype=float)), shape).ravel().copy()
+    hi = np.broadcast_to(np.log(np.asarray(t_hi, dtype=float)), shape).ravel().copy()
+    f_lo = np.broadcast_to(h(lo, everything), (n,)).copy()
+    f_hi = np.broadcast_to(h(hi, everything), (n,)).copy()
+    ok = ~np.isnan(f_lo) & ~np.isnan(f_hi) & (np.sign(f_lo) != np.sign(f_hi))
+
+    side = np.zeros(n, dtype=np.int8)
+    tol = 4.0 * np.finfo(float).eps
+    idx = np.flatnonzero(ok & (f_lo != 0) & (f_hi != 0))
+
+    for _ in range(max_iter):
+        if idx.size == 0:
+            break
+        a, b, fa, fb = lo[idx], hi[idx], f_lo[idx], f_hi[idx]
+        x = (a * fb - b * fa) / (fb - fa)
+        bad = ~((x > a) & (x < b))
+        x[bad] = 0.5 * (a[bad] + b[bad])
+        fx = np.broadcast_to(h(x, idx), x.shape)
+
+        left = np.sign(fx) == np.sign(fa)
+        li, ri = idx[left], idx[~left]
+        lo[li], f_lo[li] = x[left], fx[left]
+        f_hi[li[side[li] == -1]] *= 0.5
+        side[li] = -1
+        hi[ri], f_hi[ri] = x[~left], fx[~left]
+        f_lo[ri[side[ri] == 1]] *= 0.5
+        side[ri] = 1
+
+        width = hi[idx] - lo[idx]
+        done = (width <= tol * np.maximum(1.0, np.abs(x))) | (fx == 0)
+        idx = idx[~done]
+    ok[idx] = False
+
+    u = np.where(np.abs(f_lo) <= np.abs(f_hi), lo, hi)
+    u = np.where((f_lo == 0) | (f_hi == 0), np.where(f_lo == 0, lo, hi), u).reshape(shape)
+    ok = ok.reshape(shape)
+    t = np.where(ok, np.exp(u), np.nan)
+    delta = np.where(ok, np.broadcast_to(delta_dyn(np.exp(u), **{k: v.reshape(shape) for k, v in flat.items()}), shape), np.nan)
+    return MeetingPoint(t=t, delta=delta, converged=ok)
+
+
+def meeting_phase_diagram(visibilities, D_stars, **params) -> MeetingPoint:
+    """Meeting time t_m(V, D*) on the full 2-D grid (visibility rows, D* columns)."""
+    V = np.asarray(visibilities, dtype=float)[:, None]
+    D = np.asarray(D_stars, dtype=float)[None, :]
+    return solve_meeting_point(visibility=V, D_star=D, **params)
+
+
+@dataclass(frozen=True)
+class Boundary:
+    """Zero contour as polylines (axis units) plus refinement statistics."""
+
+    polylines: List[np.ndarray]
+    axes: Tuple[str, str]
+    cell_size: Tuple[float, float]
+    n_evaluations: int
+    n_leaf_cells: int
+
+
+# Marching-squares edges (0=bottom, 1=right, 2=top, 3=left) and the corner
+# bits at their ends: a=1 (x0,y0), b=2 (x1,y0), c=4 (x1,y1), d=8 (x0,y1).
+_CROSSED = ((0, 1, 2), (1, 2, 4), (2, 4, 8), (3, 8, 1))
+
+
+def _axis_map(lo: float, hi: float, log: bool):
+    if log:
+        a, b = np.log10(lo), np.log10(hi)
+        return lambda u: 10.0 ** (a + u * (b - a)), b - a
+    return lambda u: lo + u * (hi - lo), hi - lo
+
+
+def trace_zero_contour(
+    func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+    n_coarse: int = 16,
+    tol: float = 1e-3,
+    log_x: bool = False,
+    log_y: bool = False,
+    polish: int = 2,
+    axes: Tuple[str, str] = ("x", "y"),
+) -> Boundary:
+    """
+    Zero contour of func(X, Y) by quadtree refinement plus marching squares.
+
+    Starting from an n_coarse × n_coarse grid, only cells whose corner
+    signs differ are split (four children, five new points per cell,
+    one vectorized `func` call per level, shared edge midpoints
+    deduplicated) until the cell size is ≤ tol of the domain. The cost is
+    O(boundary length / tol) evaluations instead of O(1 / tol²).
+    Contour crossings on the leaf edges are linearly interpolated, then
+    improved by `polish` regula falsi steps along each edge; saddle cells
+    are resolved with the mean corner value. Features smaller than a
+    coarse cell (a contour entering and leaving through one edge) can be
+    missed, as with any corner-sampled method.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized f(X, Y) on arrays of axis values.
+    x_range, y_range : (float, float)
+        Domain; log axes are refined uniformly in log10.
+    tol : float
+        Final cell size relative to the domain (per axis).
+    axes : (str, str)
+        Axis labels stored on the result.
+
+    Returns
+    -------
+    Boundary
+        Polylines ordered along the contour; closed loops repeat their
+        first point.
+    """
+    fx, span_x = _axis_map(*x_range, log_x)
+    fy, span_y = _axis_map(*y_range, log_y)
+    n = int(n_coarse)
+    depth = max(0, int(np.ceil(np.log2(1.0 / (n * tol)))))
+    M = n << depth
+    n_eval = 0
+
+    def f_lattice(i, j):
+        nonlocal n_eval
+        n_eval += i.size
+        return np.asarray(func(fx(i / M), fy(j / M)), dtype=float)
+
+    # Level 0: full coarse grid.
+    step = 1 << depth
+    gi, gj = np.meshgrid(np.arange(n + 1) * step, np.arange(n + 1) * step, indexing="ij")
+    grid = f_lattice(gi.ravel(), gj.ravel()).reshape(n + 1, n + 1)
+    ci, cj = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    ci, cj = ci.ravel(), cj.ravel()
+    i, j = ci * step, cj * step
+    corners = np.stack([grid[ci, cj], grid[ci + 1, cj], grid[ci + 1, cj + 1], grid[ci, cj + 1]], axis=-1)
+
+    def active(vals):
+        pos = vals > 0
+        return np.all(np.isfinite(vals), axis=-1) & np.any(pos, axis=-1) & ~np.all(pos, axis=-1)
+
+    keep = active(corners)
+    i, j, corners = i[keep], j[keep], corners[keep]
+
+    for _ in range(depth):
+        step >>= 1
+        pts_i = np.concatenate([i + step, i + 2 * step, i + step, i, i + step])
+        pts_j = np.concatenate([j, j + step, j + 2 * step, j + step, j + step])
+        keys, inv = np.unique(pts_i * (M + 1) + pts_j, return_inverse=True)
+        vals = f_lattice(keys // (M + 1), keys % (M + 1))[inv].reshape(5, -1)
+        bottom, right, top, left, centre = vals
+        a, b, c, d = corners.T
+        i = np.concatenate([i, i + step, i + step, i])
+        j = np.concatenate([j, j, j + step, j + step])
+        corners = np.concatenate(
+            [
+                np.stack([a, bottom, centre, left], axis=-1),
+                np.stack([bottom, b, right, centre], axis=-1),
+                np.stack([centre, right, c, top], axis=-1),
+                np.stack([left, centre, top, d], axis=-1),
+            ]
+        )
+        keep = active(corners)
+        i, j, corners = i[keep], j[keep], corners[keep]
+
+    # Marching squares on the leaf cells (unit lattice size).
+    bits = (corners > 0) @ np.array([1, 2, 4, 8])
+    crossed = np.stack([((bits & m1) > 0) != ((bits & m2) > 0) for _, m1, m2 in _CROSSED], axis=-1)
+    edge_ids = np.stack(
+        [
+            2 * (i * (M + 1) + j),
+            2 * ((i + 1) * (M + 1) + j) + 1,
+            2 * (i * (M + 1) + j + 1),
+            2 * (i * (M + 1) + j) + 1,
+        ],
+        axis=-1,
+    )
+    saddle = crossed.sum(axis=1) == 4
+    plain = ~saddle
+    order = np.argsort(~crossed[plain], axis=1, kind="stable")[:, :2]
+    segs = [np.take_along_axis(edge_ids[plain], order, axis=1)]
+    if np.any(saddle):
+        e = edge_ids[saddle]
+        same = (corners[saddle].mean(axis=1) > 0) == (corners[saddle, 0] > 0)
+        first = np.where(same[:, None], e[:, [0, 1]], e[:, [3, 0]])
+        second = np.where(same[:, None], e[:, [2, 3]], e[:, [1, 2]])
+        segs += [first, second]
+    segs = np.concatenate(segs)
+
+    # Crossing point on every distinct edge: interpolate, then regula falsi.
+    edges, inv = np.unique(segs.ravel(), return_inverse=True)
+    node = edges // 2
+    ei, ej = node // (M + 1), node % (M + 1)
+    vertical = (edges % 2).astype(bool)
+    di, dj = (~vertical).astype(float), vertical.astype(float)
+    lo_u, hi_u = np.zeros(edges.size), np.ones(edges.size)
+    # Edge end values come from the leaf corners (bottom, right, top, left).
+    ids, first = np.unique(edge_ids.ravel(), return_index=True)
+    at = first[np.searchsorted(ids, edges)]
+    f_lo = corners[:, [0, 1, 3, 0]].ravel()[at]
+    f_hi = corners[:, [1, 2, 2, 3]].ravel()[at]
+    s = f_lo / (f_lo - f_hi)
+    for _ in range(int(polish)):
+        f_s = f_lattice(ei + di * s, ej + dj * s)
+        left = np.sign(f_s) == np.sign(f_lo)
+        lo_u, f_lo = np.where(left, s, lo_u), np.where(left, f_s, f_lo)
+        hi_u, f_hi = np.where(left, hi_u, s), np.where(left, f_hi, f_s)
+        s = np.where(f_s == 0, s, lo_u + (hi_u - lo_u) * f_lo / (f_lo - f_hi))
+    points = np.stack([fx((ei + di * s) / M), fy((ej + dj * s) / M)], axis=-1)
+
+    # Link segments (pairs of edge indices) into polylines.
+    pairs = inv.reshape(-1, 2)
+    neighbours: Dict[int, List[int]] = {}
+    for a, b in pairs.tolist():
+        neighbours.setdefault(a, []).append(b)
+        neighbours.setdefault(b, []).append(a)
+    seen = set()
+    polylines = []
+    starts = [k for k, v in neighbours.items() if len(v) == 1] + list(neighbours)
+    for start in starts:
+        if start in seen:
+            continue
+        path, prev, cur = [start], None, start
+        seen.add(start)
+        while True:
+            nxt = [k for k in neighbours[cur] if k != prev and (k not in seen or (k == start and len(path) > 2))]
+            if not nxt:
+                break
+            prev, cur = cur, nxt[0]
+            path.append(cur)
+            if cur == start:
+                break
+            seen.add(cur)
+        polylines.append(points[path])
+
+    return Boundary(
+        polylines=polylines,
+        axes=tuple(axes),
+        cell_size=(span_x / M, span_y / M),
+        n_evaluations=int(n_eval),
+        n_leaf_cells=int(i.size),
+    )
+
+
+def trace_meeting_boundary(
+    x_axis: Tuple[str, float, float],
+    y_axis: Tuple[str, float, float],
+    delta_inf: ScaleFn = delta_inf_interferometer,
+    delta_dyn: ScaleFn = delta_dyn_inverse_time,
+    log_x: bool = True,
+    log_y: bool = False,
+    n_coarse: int = 16,
+    tol: float = 1e-3,
+    polish: int = 2,
+    **params,
+) -> Boundary:
+    """
+    Meeting-point boundary log δ_inf = log δ_dyn in a 2-D parameter plane.
+
+    Parameters
+    ----------
+    x_axis, y_axis : (name, lo, hi)
+        Axis parameter names and ranges; "t" is the interrogation time,
+        any other name is passed to the scale functions as a keyword
+        (e.g. ("t", 1e-2, 1e2), ("visibility", 0.05, 1.0)).
+    **params
+        Fixed parameters; must include t if it is not an axis.
+
+    Returns
+    -------
+    Boundary
+        See `trace_zero_contour`.
+    """
+    (x_name, *x_range), (y_name, *y_range) = x_axis, y_axis
+    log_inf, log_dyn = _log_scale(delta_inf), _log_scale(delta_dyn)
+
+    def h(X, Y):
+        p = dict(params)
+        p[x_name], p[y_name] = X, Y
+        t = p.pop("t")
+        return log_inf(t, **p) - log_dyn(t, **p)
+
+    return trace_zero_contour(
+        h,
+        tuple(x_range),
+        tuple(y_range),
+        n_coarse=n_coarse,
+        tol=tol,
+        log_x=log_x,
+        log_y=log_y,
+        polish=polish,
+        axes=(x_name, y_name),
+    )
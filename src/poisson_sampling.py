@@ -0,0 +1,189 @@
+"""
+poisson_sampling.py — shared vectorized Poisson sampler for the Monte Carlo sims
+
+Every photon-limited simulation in src/sims draws detection counts
+N ~ Poisson(λ) with λ spanning many decades (λ = Φ δt for Φ up to 1e4+).
+This module replaces the per-script scalar `poisson_safe` helpers with a
+single array-native sampler.
+
+Per-element method selection:
+- λ < LAM_PTRS (= 10)        exact sampling (inversion, via NumPy)
+- LAM_PTRS ≤ λ ≤ LAM_NORMAL  exact sampling (PTRS transformed rejection,
+                             Hörmann 1993, via NumPy)
+- λ > LAM_NORMAL (= 1e8)     normal approximation with continuity correction:
+                                 N = floor(λ + √λ Z + 1/2)
+
+Accuracy:
+- The first two regimes are exact up to the underlying bit generator.
+- In the normal regime the Kolmogorov distance to Poisson(λ) is bounded
+  by the Berry–Esseen term ~ 0.4 / √λ ≤ 4e-5; mean and variance are
+  exact to O(1) counts, i.e. relative error ≤ 1e-8.
+
+Clamping policy (single, explicit):
+- invalid λ (NaN, ±inf, negative) raises ValueError;
+- the returned counts are always ≥ `min_count` (default 0). Models that
+  divide by N (localization balance, CTRW ratio) pass `min_count=1`.
+
+Randomness:
+- `rng=None` draws from NumPy's legacy global state, so
+  `stats_utils.set_seed` keeps controlling reproducibility.
+- Pass a `np.random.Generator` for independent streams.
+
+Quasi-Monte Carlo:
+- `sobol_uniforms` gives scrambled Sobol points (randomized QMC; each
+  scrambling is one independent replicate), and `poisson_ppf` maps
+  uniforms to counts by exact inverse CDF, so a count is a monotone
+  function of one uniform. The sims expose this as `sampler="qmc"`.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Union
+
+import numpy as np
+from scipy.special import gammaln, ndtri, pdtr
+from scipy.stats import qmc
+
+LAM_PTRS = 10.0
+LAM_NORMAL = 1.0e8
+
+RandomState = Union[np.random.Generator, np.random.RandomState, None]
+
+
+def _source(rng: RandomState):
+    """Return the object that provides `poisson` / `standard_normal`."""
+    return np.random if rng is None else rng
+
+
+def poisson_sample(
+    lam,
+    rng: RandomState = None,
+    min_count: int = 0,
+    size: Optional[tuple] = None,
+) -> np.ndarray:
+    """
+    Draw Poisson counts for an array of rates.
+
+    Parameters
+    ----------
+    lam : array_like
+        Poisson rates λ ≥ 0, any shape.
+    rng : np.random.Generator, np.random.RandomState or None
+        Random source (None = legacy global state).
+    min_count : int
+        Lower clamp applied to every count.
+    size : tuple, optional
+        Output shape; must be broadcast-compatible with `lam`
+        (e.g. `(n_mc, n_phi)` with `lam` of shape `(n_phi,)`).
+
+    Returns
+    -------
+    np.ndarray
+        int64 counts of shape `size` (or `np.shape(lam)`).
+    """
+    lam = np.asarray(lam, dtype=float)
+    if not np.all(np.isfinite(lam)) or np.any(lam < 0.0):
+        raise ValueError("Invalid Poisson rate: lam must be finite and >= 0")
+
+    shape = lam.shape if size is None else tuple(size)
+    lam = np.broadcast_to(lam, shape)
+    src = _source(rng)
+
+    out = np.empty(shape, dtype=np.int64)
+    big = lam > LAM_NORMAL
+
+    if not np.any(big):
+        out[...] = src.poisson(lam)
+    else:
+        small = ~big
+        if np.any(small):
+            out[small] = src.poisson(lam[small])
+        lam_big = lam[big]
+        z = src.standard_normal(lam_big.shape)
+        out[big] = np.floor(lam_big + np.sqrt(lam_big) * z + 0.5).astype(np.int64)
+
+    if min_count:
+        np.maximum(out, min_count, out=out)
+    elif np.any(big):
+        np.maximum(out, 0, out=out)
+    return out
+
+
+def poisson_ppf(u, lam, min_count: int = 0) -> np.ndarray:
+    """
+    Poisson counts by inverse CDF: the smallest N with P(N; λ) ≥ u.
+
+    Starts from the Cornish–Fisher guess λ + √λ z + (z² - 1)/6
+    (z = Φ⁻¹(u)) and steps to the exact quantile with `pdtr`, only on the
+    lanes that still need it (typically 0–2 steps). `u` and `lam`
+    broadcast; u is clipped into (0, 1) so that scrambled points can
+    never hit the endpoints.
+    """
+    lam = np.asarray(lam, dtype=float)
+    if not np.all(np.isfinite(lam)) or np.any(lam < 0.0):
+        raise ValueError("Invalid Poisson rate: lam must be finite and >= 0")
+    tiny = np.finfo(float).tiny
+    u = np.clip(np.asarray(u, dtype=float), tiny, 1.0 - np.finfo(float).epsneg)
+    u, lam = np.broadcast_arrays(u, lam)
+
+    z = ndtri(u)
+    k = np.maximum(np.floor(lam + np.sqrt(lam) * z + (z * z - 1.0) / 6.0), 0.0)
+    up = pdtr(k, lam) < u
+    while np.any(up):
+        k[up] += 1.0
+        up[up] = pdtr(k[up], lam[up]) < u[up]
+    down = (k > 0) & (pdtr(k - 1.0, lam) >= u)
+    while np.any(down):
+        k[down] -= 1.0
+        down[down] = (k[down] > 0) & (pdtr(k[down] - 1.0, lam[down]) >= u[down])
+
+    out = k.astype(np.int64)
+    if min_count:
+        np.maximum(out, min_count, out=out)
+    return out
+
+
+def sobol_uniforms(n: int, d: int, rng: RandomState = None) -> np.ndarray:
+    """
+    n scrambled Sobol points in [0, 1)^d (one randomized-QMC replicate).
+
+    Use powers of two for n: other sizes take the first n points of the
+    next power of two and lose the balance property of the sequence.
+    The scrambling is seeded from `rng` (None = legacy global state,
+    like `poisson_sample`).
+    """
+    if rng is None or isinstance(rng, np.random.RandomState):
+        rng = np.random.default_rng(_source(rng).randint(0, 2**31 - 1))
+    m = max(0, int(np.ceil(np.log2(max(int(n), 1)))))
+    return qmc.Sobol(int(d), scramble=True, seed=rng).random_base2(m)[: int(n)]
+
+
+def poisson_expectation(g, lam, *params, n_sigma: float = 12.0, chunk_elems: int = 2**24) -> np.ndarray:
+    """
+    Exact E[g(N)], N ~ Poisson(λ), for an elementwise function g of the count.
+
+    Sums g against the pmf over λ ± n_sigma (√λ + 1); lanes are bucketed
+    by power-of-two window width so small λ does not pay for the widest
+    window. Extra `params` are per-lane arrays broadcast against λ and
+    passed to g as g(N, *params), each sliced like N (lanes × window).
+    """
+    lam, *params = np.broadcast_arrays(np.asarray(lam, dtype=float), *(np.asarray(a, dtype=float) for a in params))
+    if not np.all(np.isfinite(lam)) or np.any(lam < 0.0):
+        raise ValueError("Invalid Poisson rate: lam must be finite and >= 0")
+    mu = lam.ravel()
+    params = [a.ravel() for a in params]
+    half = np.ceil(n_sigma * (np.sqrt(mu) + 1.0))
+    lo = np.maximum(0.0, np.floor(mu) - half)
+    width = 2 ** np.ceil(np.log2(2.0 * half + 1.0)).astype(int)
+
+    out = np.empty(mu.size)
+    for wd in np.unique(width):
+        members = np.flatnonzero(width == wd)
+        k = np.arange(wd, dtype=float)
+        step = max(1, int(chunk_elems) // int(wd))
+        for s in range(0, members.size, step):
+            sl = members[s:s + step]
+            N = lo[sl, None] + k[None, :]
+            w = np.exp(N * np.log(np.maximum(mu[sl, None], np.finfo(float).tiny)) - mu[sl, None] - gammaln(N + 1.0))
+            out[sl] = np.sum(w * g(N, *(a[sl, None] for a in params)), axis=1)
+    return out.reshape(lam.shape)[()]
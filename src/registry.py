@@ -0,0 +1,127 @@
+"""
+registry.py — single registry of pipeline stages (sims, sweeps, figures)
+
+Every runnable module under src/sims and src/figs is listed here once,
+in pipeline order. Nothing is imported until a stage runs, so the CLI
+(`python -m src`) starts without numpy/scipy/matplotlib.
+
+Stage kinds:
+    sim    single simulation script
+    sweep  multi-seed / parameter sweep (parallel through `src.executor`)
+    fig    figure generator (reads results/)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import pkgutil
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+KINDS = ("sim", "sweep", "fig")
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    module: str
+    kind: str
+    title: str
+
+
+def _sim(name: str, title: str, kind: str = "sim") -> Stage:
+    return Stage(name, f"src.sims.{name}", kind, title)
+
+
+def _fig(name: str, title: str) -> Stage:
+    return Stage(name, f"src.figs.{name}", "fig", title)
+
+
+STAGES: Tuple[Stage, ...] = (
+    _sim("diffusion_localization_mc", "Diffusion localization (Φ^{-1/3})"),
+    _sim("ctrw_mc", "CTRW / anomalous diffusion scalings"),
+    _sim("ramsey_meeting_point_mc", "Ramsey meeting-point phase diagram"),
+    _sim("mzi_meeting_point_mc", "Mach–Zehnder meeting-point phase diagram"),
+    _sim("phi_scaling_multiseed", "Multi-seed exponent robustness", kind="sweep"),
+    _sim("ctrw_alpha_sweep", "CTRW alpha sweep", kind="sweep"),
+    _sim("ramsey_optimal_time_under_dephasing", "Ramsey optimal time under dephasing"),
+    _sim("ou_fisher_mc", "OU trajectory Fisher validation"),
+    _sim("poisson_stream_mc", "Inhomogeneous Poisson photon streams"),
+    _sim("ctrw_trajectory_mc", "CTRW trajectories + Poisson localization"),
+    _sim("stopping_time_mc", "Distinguishability stopping times"),
+    _sim("interferometer_estimator_mc", "Finite-shot ML phase estimation vs CRB"),
+    _sim("photon_localization_mc", "Photon-by-photon localization (Φ^{-1/3})"),
+    _sim("lindblad_noise_bound_mc", "Lindblad check of the noise-suppression bound"),
+    _sim("adaptive_phi_scaling", "Adaptive Φ-grid refinement of scaling exponents"),
+    _sim("qmc_efficiency_mc", "Randomized QMC vs MC for the δt statistics"),
+    _fig("fig1_overview", "Overview"),
+    _fig("fig2_master_inequality_cartoon", "Master inequality cartoon"),
+    _fig("fig3_phi_scaling", "Φ scaling"),
+    _fig("fig4_ou_gamma_bound", "OU γ bound"),
+    _fig("fig5_ramsey_phase_diagram", "Ramsey phase diagram"),
+    _fig("fig6_mzi_visibility", "MZI visibility"),
+    _fig("fig7_noise_suppression_bound", "Noise suppression bound"),
+    _fig("fig8_phi_slope_hist", "Φ slope histogram"),
+    _fig("fig9_ctrw_alpha_sweep", "CTRW alpha sweep"),
+    _fig("fig10_ramsey_optimal_time", "Ramsey optimal time"),
+    _fig("fig11_ou_fisher_mc", "OU Fisher Monte Carlo"),
+    _fig("fig12_poisson_stream", "Inhomogeneous Poisson streams"),
+    _fig("fig13_ctrw_trajectory", "CTRW trajectories: MSD and Φ scaling"),
+    _fig("fig14_stopping_times", "Distinguishability stopping times"),
+    _fig("fig15_interferometer_estimator", "Finite-shot ML phase estimation"),
+    _fig("fig16_photon_localization", "Photon-by-photon localization"),
+    _fig("fig17_lindblad_noise_bound", "Lindblad noise-bound check"),
+    _fig("fig18_adaptive_phi_scaling", "Adaptive Φ-grid exponents"),
+    _fig("fig19_qmc_efficiency", "Randomized QMC vs MC"),
+)
+
+
+def _split(patterns: Optional[Sequence[str]]) -> List[str]:
+    out: List[str] = []
+    for p in patterns or ():
+        out.extend(x.strip() for x in p.split(",") if x.strip())
+    return out
+
+
+def select(
+    kinds: Optional[Sequence[str]] = None,
+    names: Optional[Sequence[str]] = None,
+    only: Optional[Sequence[str]] = None,
+    skip: Optional[Sequence[str]] = None,
+) -> List[Stage]:
+    """
+    Stages in pipeline order, filtered by kind, explicit names and
+    --only / --skip glob patterns (comma-separated or repeated).
+    """
+    names, only, skip = _split(names), _split(only), _split(skip)
+    known = {s.name for s in STAGES}
+    unknown = [n for n in names if n not in known and not any(fnmatch.fnmatch(k, n) for k in known)]
+    if unknown:
+        raise ValueError(f"unknown stage(s): {', '.join(unknown)}")
+
+    out = []
+    for s in STAGES:
+        if kinds and s.kind not in kinds:
+            continue
+        if names and not any(fnmatch.fnmatch(s.name, n) for n in names):
+            continue
+        if only and not any(fnmatch.fnmatch(s.name, p) for p in only):
+            continue
+        if any(fnmatch.fnmatch(s.name, p) for p in skip):
+            continue
+        out.append(s)
+    return out
+
+
+def unregistered() -> List[str]:
+    """Modules under src/sims and src/figs that are missing from STAGES."""
+    root = os.path.dirname(__file__)
+    known = {s.module for s in STAGES}
+    missing = []
+    for pkg in ("sims", "figs"):
+        for info in pkgutil.iter_modules([os.path.join(root, pkg)]):
+            mod = f"src.{pkg}.{info.name}"
+            if mod not in known:
+                missing.append(mod)
+    return missing
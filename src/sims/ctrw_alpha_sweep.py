@@ -11,6 +11,9 @@ Platinum:
 - multi-seed per alpha (n_rep >= 20)
 - mean/std
 - bootstrap 95% CI for mean slope
+- (α, rep) tasks run through `src.executor.run_into` (--jobs, --backend);
+  each task draws from its own RandomState stream (same numbers as
+  set_seed), so results do not depend on the backend or number of workers
 """
 
 from __future__ import annotations
@@ -18,8 +21,9 @@ from __future__ import annotations
 import numpy as np
 
 from src.io_utils import save_json
-from src.stats_utils import linear_regression_loglog, set_seed
-from src.config import RNG_DEFAULT
+from src.stats_utils import linear_regression_loglog
+from src.config import RNG_DEFAULT, budget
+from src.executor import run_into
 from src.sims.ctrw_mc import run_simulation
 
 
@@ -37,15 +41,22 @@ def bootstrap_ci_mean(values: np.ndarray, n_boot: int = 2000, alpha: float = 0.0
     return lo, hi
 
 
+def _rep_slope(task, rng) -> float:
+    alpha, phi_values, n_mc = task
+    dt = run_simulation(phi_values, alpha=alpha, n_mc=n_mc, rng=rng)
+    slope, _ = linear_regression_loglog(phi_values, dt)
+    return float(slope)
+
+
 def main():
     base_seed = int(getattr(RNG_DEFAULT, "seed", 12345))
 
     phi_values = np.logspace(1, 4, 8)
     alphas = np.linspace(0.3, 1.7, 8)
 
-    # Compute budget (safe for Codespaces)
-    n_mc = 800
-    n_rep = 20
+    # Compute budget (safe for Codespaces; scaled by the run profile)
+    n_mc = budget(800)
+    n_rep = budget(20, minimum=3)
 
     slopes_mean = []
     slopes_std = []
@@ -53,16 +64,13 @@ def main():
     slopes_rep = []
     expected = []
 
-    for i, a in enumerate(alphas):
-        rep_slopes = []
-        for r in range(n_rep):
-            set_seed(base_seed + 10_000 * i + r)
+    tasks = [(float(a), phi_values, int(n_mc)) for a in alphas for _ in range(n_rep)]
+    seeds = [base_seed + 10_000 * i + r for i in range(alphas.size) for r in range(n_rep)]
+    all_slopes = np.empty((alphas.size, n_rep))
+    run_into(_rep_slope, tasks, seeds, all_slopes.reshape(-1), rng_factory=np.random.RandomState)
 
-            dt = run_simulation(phi_values, alpha=float(a), n_mc=int(n_mc))
-            slope, _ = linear_regression_loglog(phi_values, dt)
-            rep_slopes.append(float(slope))
-
-        rep_slopes = np.array(rep_slopes, dtype=float)
+    for i, a in enumerate(alphas):
+        rep_slopes = all_slopes[i]
         mu = float(rep_slopes.mean())
         sd = float(rep_slopes.std(ddof=1)) if rep_slopes.size > 1 else 0.0
         ci_lo, ci_hi = bootstrap_ci_mean(rep_slopes, n_boot=2000, alpha=0.05, seed=777 + i)
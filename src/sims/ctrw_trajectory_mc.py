@@ -0,0 +1,210 @@
+"""
+ctrw_trajectory_mc.py — continuous-time random walk trajectories + Poisson localization
+
+Unlike `ctrw_mc` (which perturbs the fixed-point scaling with a Poisson
+count), this module simulates actual CTRW walkers:
+
+- waiting times with tail exponent α ∈ (0, 1):
+    "mittag-leffler": exact ML law (Kozubowski–Rachev transform),
+                      MSD(t) = ℓ² (t/τ0)^α / Γ(1+α) at all t;
+    "pareto":         Lomax law τ0 (U^{-1/α} - 1), same tail, MSD ∝ t^α
+                      only asymptotically;
+- Gaussian jumps of size ℓ, accumulated with cumulative sums over blocks
+  of jumps for a whole batch of walkers;
+- positions sampled on an observation grid (`kernels.ctrw_advance`:
+  row-wise searchsorted on the flattened epoch array, or a per-walker
+  Numba loop when installed), written batch by batch to a memory-mapped
+  .npy under results/ so ensembles may exceed RAM.
+
+The ensemble MSD then drives the Poisson localization balance of
+`diffusion_localization_mc`,
+
+    MSD(δt) ≈ σ_m² / √N,   N ~ Poisson(Φ δt),
+
+solved per sample by damped fixed-point iteration on the measured MSD curve.
+With MSD ∝ t^α this balance gives δt^α ∝ (Φ δt)^{-1/2}, i.e.
+δt ∝ Φ^{-1/(1+2α)}. That differs from the paper's Φ^{-1/(2+α)}, which
+`ctrw_mc` (and the "ctrw" model of `adaptive_phi_scaling`) imposes as
+its fixed-point ansatz rather than deriving from the dynamics; the two
+coincide only at α = 1 (Φ^{-1/3}, the Brownian case). The JSON reports
+the balance exponent as "expected_slope" and the paper's value as
+"paper_slope"; this run does not test the latter.
+
+Outputs:
+- results/ctrw_positions_alpha<α>.npy (memmap, walkers × grid)
+- results/ctrw_trajectory_mc.json
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from src.config import RNG_DEFAULT, budget
+from src.io_utils import open_memmap, save_json
+from src.kernels import ctrw_advance
+from src.poisson_sampling import poisson_sample
+from src.stats_utils import linear_regression_loglog
+
+
+def waiting_times(alpha: float, size, rng: np.random.Generator, law: str = "mittag-leffler", tau0: float = 1.0):
+    """Heavy-tailed waiting times with tail exponent α."""
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError("alpha must be in (0, 1]")
+    u = rng.uniform(size=size)
+    if law == "pareto":
+        return tau0 * (u ** (-1.0 / alpha) - 1.0)
+    if law != "mittag-leffler":
+        raise ValueError(f"unknown waiting-time law: {law}")
+    if alpha == 1.0:
+        return -tau0 * np.log(u)
+    v = rng.uniform(size=size)
+    a = alpha * math.pi
+    return -tau0 * np.log(u) * (math.sin(a) / np.tan(a * v) - math.cos(a)) ** (1.0 / alpha)
+
+
+def simulate_positions(
+    alpha: float,
+    t_obs: np.ndarray,
+    n_walkers: int,
+    rng: np.random.Generator,
+    law: str = "mittag-leffler",
+    tau0: float = 1.0,
+    jump: float = 1.0,
+    block_jumps: int = 64,
+) -> np.ndarray:
+    """
+    Positions x(t) of n_walkers CTRW walkers (x(0) = 0) on the grid t_obs.
+
+    Walkers advance in blocks of `block_jumps` jumps; walkers whose last
+    epoch passes max(t_obs) leave the active set.
+
+    Returns
+    -------
+    np.ndarray
+        Positions of shape (n_walkers, t_obs.size).
+    """
+    t_obs = np.asarray(t_obs, dtype=float)
+    t_max = float(t_obs[-1])
+
+    out = np.zeros((n_walkers, t_obs.size))
+    active = np.arange(n_walkers)
+    epoch = np.zeros(n_walkers)
+    pos = np.zeros(n_walkers)
+
+    while active.size:
+        b = active.size
+        waits = waiting_times(alpha, (b, block_jumps), rng, law, tau0)
+        steps = rng.standard_normal((b, block_jumps)) * jump
+        rows = out[active]
+        epoch[active], pos[active] = ctrw_advance(epoch[active], pos[active], waits, steps, t_obs, rows)
+        out[active] = rows
+        active = active[epoch[active] <= t_max]
+
+    return out
+
+
+def run_ensemble(
+    alpha: float,
+    t_obs: np.ndarray,
+    n_walkers: int,
+    filename: str,
+    batch: int = 20_000,
+    seed: int = RNG_DEFAULT.seed,
+    **kwargs,
+) -> np.memmap:
+    """Simulate the ensemble batch by batch into results/<filename> (memmap)."""
+    mm = open_memmap(filename, shape=(n_walkers, np.size(t_obs)), dtype=np.float32)
+    for k, start in enumerate(range(0, n_walkers, batch)):
+        stop = min(n_walkers, start + batch)
+        rng = np.random.default_rng([int(seed), k])
+        mm[start:stop] = simulate_positions(alpha, t_obs, stop - start, rng, **kwargs)
+    mm.flush()
+    return mm
+
+
+def ensemble_msd(positions: np.ndarray, batch: int = 20_000) -> np.ndarray:
+    """Ensemble MSD ⟨x(t)²⟩, streamed over walker batches (memmap-friendly)."""
+    acc = np.zeros(positions.shape[1])
+    for start in range(0, positions.shape[0], batch):
+        x = np.asarray(positions[start:start + batch], dtype=float)
+        acc += np.einsum("ij,ij->j", x, x)
+    return acc / positions.shape[0]
+
+
+def sample_delta_t(phi_values, t_obs, msd, sigma_m: float = 1.0, n_mc: int = 2000, rng=None, n_iter: int = 10):
+    """
+    Fixed-point samples of δt from the balance MSD(δt) = σ_m²/√N.
+
+    MSD is inverted by log-log interpolation on the measured curve. With
+    MSD ∝ t^α the plain iteration has log-derivative -1/(2α) and does not
+    contract for α ≤ 1/2, so the update is damped in log space with
+    ω = 2α/(2α+1) (α = fitted MSD slope), which cancels the linear term.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_phi, n_mc).
+    """
+    t_obs = np.asarray(t_obs, dtype=float)
+    log_t = np.log(t_obs)
+    log_msd = np.log(np.maximum.accumulate(np.maximum(msd, 1e-300)))
+    a_fit, _ = linear_regression_loglog(t_obs, np.exp(log_msd))
+    omega = 2.0 * a_fit / (2.0 * a_fit + 1.0)
+
+    phi = np.asarray(phi_values, dtype=float)[:, None]
+    log_dt = np.full((phi.shape[0], int(n_mc)), float(np.median(log_t)))
+    for _ in range(n_iter):
+        N = poisson_sample(phi * np.exp(log_dt), rng=rng, min_count=1)
+        target = np.log(sigma_m**2 / np.sqrt(N.astype(float)))
+        log_dt = (1.0 - omega) * log_dt + omega * np.interp(target, log_msd, log_t)
+    return np.exp(log_dt)
+
+
+def main():
+    alpha = 0.6
+    law = "mittag-leffler"
+    sigma_m = 1.0
+    n_walkers = budget(200_000)
+    phi_values = np.logspace(1, 4, 8)
+
+    # Grid covering the predicted balance range for MSD = (t)^α / Γ(1+α).
+    K = 1.0 / math.gamma(1.0 + alpha)
+    pred = (sigma_m**4 / (K**2 * phi_values)) ** (1.0 / (1.0 + 2.0 * alpha))
+    t_obs = np.logspace(np.log10(pred.min()) - 1.0, np.log10(pred.max()) + 1.0, 60)
+
+    mm = run_ensemble(alpha, t_obs, n_walkers, f"ctrw_positions_alpha{alpha:g}.npy", law=law)
+    msd = ensemble_msd(mm)
+
+    rng = np.random.default_rng(RNG_DEFAULT.seed)
+    delta_t = np.median(sample_delta_t(phi_values, t_obs, msd, sigma_m=sigma_m, rng=rng), axis=1)
+    slope, intercept = linear_regression_loglog(phi_values, delta_t)
+    msd_slope, _ = linear_regression_loglog(t_obs, msd)
+
+    save_json(
+        "ctrw_trajectory_mc.json",
+        {
+            "model": "CTRW trajectories (memmap) + Poisson localization balance MSD(dt)=sigma_m^2/sqrt(N)",
+            "alpha": alpha,
+            "law": law,
+            "n_walkers": n_walkers,
+            "t_obs": t_obs.tolist(),
+            "msd": msd.tolist(),
+            "msd_slope": msd_slope,
+            "phi": phi_values.tolist(),
+            "delta_t": delta_t.tolist(),
+            "fit_slope": slope,
+            "expected_slope": -1.0 / (1.0 + 2.0 * alpha),
+            "paper_slope": -1.0 / (2.0 + alpha),
+        },
+    )
+
+    print(
+        "CTRW trajectory MSD slope: %.3f, Φ-scaling slope: %.3f (balance %.3f, paper ansatz %.3f)"
+        % (msd_slope, slope, -1.0 / (1.0 + 2.0 * alpha), -1.0 / (2.0 + alpha))
+    )
+
+
+if __name__ == "__main__":
+    main()
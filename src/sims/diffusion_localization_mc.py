@@ -13,24 +13,54 @@ Goal:
 - Empirically confirm δt_min ∝ Φ^{-1/3}
 """
 
-import math
 import numpy as np
+from scipy.special import pdtr
 
-from src.config import RNG_DEFAULT
+from src.config import RNG_DEFAULT, budget
 from src.io_utils import save_json
-from src.stats_utils import set_seed, linear_regression_loglog
+from src.kernels import balance_fixed_point
+from src.poisson_sampling import poisson_expectation, poisson_ppf, sobol_uniforms
+from src.stats_utils import control_variate_estimate, control_variate_quantile, set_seed, linear_regression_loglog
 
 
-def poisson_safe(lam: float) -> int:
-    if not np.isfinite(lam) or lam < 0.0:
-        raise ValueError(f"Invalid Poisson rate lam={lam}")
+def sample_delta_t(
+    phi_values,
+    D=1.0,
+    sigma_m=1.0,
+    n_mc=2000,
+    rng=None,
+    sampler="mc",
+    n_iter=10,
+):
+    """
+    Fixed-point samples of δt for every Φ at once.
+
+    Each of the n_mc lanes iterates the balance map
+    δt ← σ_m² / (2 D √N), N ~ Poisson(Φ δt) ≥ 1, n_iter times from
+    δt = 1e-2, in `kernels.balance_fixed_point` (Numba when installed).
+    Every count is drawn by inverse CDF from a pre-drawn uniform:
+    sampler="mc" takes them from `rng.random` (None = legacy global
+    state), sampler="qmc" from its own scrambled Sobol dimension per
+    (step, Φ) (n_iter · n_phi dimensions; use a power-of-two n_mc).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_phi, n_mc).
+    """
+    phi = np.asarray(phi_values, dtype=float)
+    if sampler == "qmc":
+        u = sobol_uniforms(n_mc, n_iter * phi.size, rng).T.reshape(n_iter, phi.size, -1)
+    elif sampler == "mc":
+        u = (np.random if rng is None else rng).random((n_iter, phi.size, int(n_mc)))
+    else:
+        raise ValueError("sampler must be 'mc' or 'qmc'")
+    return balance_fixed_point(phi, u, D=D, sigma_m=sigma_m)
 
-    LAM_GAUSS = 1.0e8
-    if lam <= LAM_GAUSS:
-        return int(np.random.poisson(lam))
 
-    x = np.random.normal(loc=lam, scale=math.sqrt(lam))
-    return max(0, int(x))
+def fixed_point_delta_t(phi_values, D=1.0, sigma_m=1.0):
+    """Leading-order fixed point 2 D δt = σ_m² / √(Φ δt):  δt* = (σ_m² / 2D)^{2/3} Φ^{-1/3}."""
+    return (sigma_m**2 / (2.0 * D)) ** (2.0 / 3.0) * np.asarray(phi_values, dtype=float) ** (-1.0 / 3.0)
 
 
 def run_simulation(
@@ -38,6 +68,8 @@ def run_simulation(
     D=1.0,
     sigma_m=1.0,
     n_mc=2000,
+    rng=None,
+    sampler="mc",
 ):
     """
     Stable fixed-point Monte Carlo for diffusion localization.
@@ -45,31 +77,71 @@ def run_simulation(
     Balance condition:
         2 D δt  ≈  σ_m² / √N ,   N ~ Poisson(Φ δt)
     """
-    delta_t_est = []
+    samples = sample_delta_t(phi_values, D=D, sigma_m=sigma_m, n_mc=n_mc, rng=rng, sampler=sampler)
+    return np.median(samples, axis=1)
 
-    for Phi in phi_values:
-        samples = []
-        for _ in range(n_mc):
-            delta_t = 1e-2
-            for _ in range(10):
-                N = max(1, poisson_safe(Phi * delta_t))
-                delta_t = max(
-                    sigma_m**2 / (2.0 * D * math.sqrt(float(N))),
-                    1e-12,
-                )
-            samples.append(delta_t)
-        delta_t_est.append(np.median(samples))
 
-    return np.array(delta_t_est)
+def run_simulation_cv(
+    phi_values,
+    D=1.0,
+    sigma_m=1.0,
+    n_mc=2000,
+    rng=None,
+    n_iter=10,
+    level=0.95,
+):
+    """
+    Control-variate estimates of the mean and median of δt.
+
+    Counts are drawn by inverse CDF, so every lane can be paired with a
+    surrogate on the SAME final uniform: the last balance step evaluated
+    at the analytic fixed point, c = σ_m² / (2 D √N_c), N_c ~ Poisson(Φ δt*).
+    E[c] is an exact Poisson sum and 1{N_c ≥ m} (m = median count) has an
+    exactly known probability, giving control variates for the mean and
+    the median (`stats_utils.control_variate_estimate` / `_quantile`).
+
+    Returns
+    -------
+    dict of np.ndarray over Φ
+        mean, mean_se, mean_ci, mean_naive_se, mean_variance_reduction,
+        median, median_ci, median_variance_reduction.
+    """
+    phi = np.asarray(phi_values, dtype=float)[:, None]
+    src = np.random if rng is None else rng
+    u = src.random((n_iter, phi.shape[0], int(n_mc)))
+    y = balance_fixed_point(phi[:, 0], u, D=D, sigma_m=sigma_m)
+
+    lam_star = phi[:, 0] * fixed_point_delta_t(phi[:, 0], D=D, sigma_m=sigma_m)
+    N_c = poisson_ppf(u[-1], lam_star[:, None])
+    scale = sigma_m**2 / (2.0 * D)
+    c = scale / np.sqrt(np.maximum(N_c, 1.0))
+    c_mean = scale * poisson_expectation(lambda N: 1.0 / np.sqrt(np.maximum(N, 1.0)), lam_star)
+
+    m = poisson_ppf(0.5, lam_star)
+    p_m = 1.0 - pdtr(m - 1.0, lam_star)
+
+    mean = control_variate_estimate(y, c, c_mean, axis=1, level=level)
+    med, lo, hi, red = control_variate_quantile(y, (N_c >= m[:, None]).astype(float), p_m, q=0.5, axis=1, level=level)
+    return {
+        "mean": mean.estimate,
+        "mean_se": mean.se,
+        "mean_ci": np.stack([mean.ci_low, mean.ci_high], axis=-1),
+        "mean_naive_se": mean.naive_se,
+        "mean_variance_reduction": mean.variance_reduction,
+        "median": med,
+        "median_ci": np.stack([lo, hi], axis=-1),
+        "median_variance_reduction": red,
+    }
 
 
 def main():
     set_seed(RNG_DEFAULT.seed)
 
     phi_values = np.logspace(1, 4, 8)
-    delta_t = run_simulation(phi_values)
+    delta_t = run_simulation(phi_values, n_mc=budget(2000))
 
     slope, intercept = linear_regression_loglog(phi_values, delta_t)
+    cv = run_simulation_cv(phi_values, n_mc=budget(2000))
 
     save_json(
         "diffusion_phi_scaling.json",
@@ -79,10 +151,15 @@ def main():
             "fit_slope": slope,
             "fit_intercept": intercept,
             "expected_slope": -1.0 / 3.0,
+            "control_variate": {k: v.tolist() for k, v in cv.items()},
         },
     )
 
     print("Φ-scaling fit slope:", slope)
+    print(
+        "Control variates: variance reduction mean x%.3g, median x%.3g (medians over Φ)"
+        % (np.median(cv["mean_variance_reduction"]), np.median(cv["median_variance_reduction"]))
+    )
 
 
 if __name__ == "__main__":
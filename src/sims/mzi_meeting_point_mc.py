@@ -17,7 +17,7 @@ import numpy as np
 from src.config import RNG_DEFAULT
 from src.io_utils import save_json
 from src.stats_utils import set_seed
-from src.fisher.mzi_fisher import mzi_fisher_max
+from src.meeting_point import meeting_curves, meeting_phase_diagram, solve_meeting_point
 
 
 def run_simulation(
@@ -27,19 +27,11 @@ def run_simulation(
 ):
     """
     Compute inference and dynamical scales for each effective interrogation time.
-    """
-    delta_inf = []
-    delta_dyn = []
-
-    for t in times:
-        # Accumulated Fisher
-        I_t = t * mzi_fisher_max(visibility)
-        delta_inf.append(np.sqrt(2.0 * D_star / I_t))
-
-        # Geometric phase scale
-        delta_dyn.append(1.0 / t)
 
-    return np.array(delta_inf), np.array(delta_dyn)
+    δ_inf = sqrt(2 D* / (t V²)) (accumulated Fisher t·I_max, I_max = V²),
+    δ_dyn = 1/t; evaluated on the whole grid at once.
+    """
+    return meeting_curves(times, visibility=visibility, D_star=D_star)
 
 
 def main():
@@ -49,6 +41,11 @@ def main():
     visibility = 0.7
 
     delta_inf, delta_dyn = run_simulation(times, visibility)
+    meeting = solve_meeting_point(visibility=visibility, D_star=1.0)
+
+    visibilities = np.linspace(0.05, 1.0, 96)
+    D_stars = np.logspace(-1, 1, 81)
+    diagram = meeting_phase_diagram(visibilities, D_stars)
 
     save_json(
         "mzi_meeting_point.json",
@@ -57,6 +54,13 @@ def main():
             "visibility": visibility,
             "delta_inf": delta_inf.tolist(),
             "delta_dyn": delta_dyn.tolist(),
+            "meeting_t": float(meeting.t),
+            "meeting_delta": float(meeting.delta),
+            "phase_diagram": {
+                "visibility": visibilities.tolist(),
+                "D_star": D_stars.tolist(),
+                "t_meet": diagram.t.tolist(),
+            },
         },
     )
 
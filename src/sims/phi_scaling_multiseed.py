@@ -12,6 +12,8 @@ Platinum:
   - multi-seed slopes (>=20)
   - mean/std
   - bootstrap 95% CI for mean slope
+  - seeds run through `src.executor.run_into` (--jobs, --backend), one
+    RandomState stream per task (same numbers as set_seed)
 """
 
 from __future__ import annotations
@@ -22,8 +24,9 @@ from pathlib import Path
 
 import numpy as np
 
-from src.stats_utils import set_seed, linear_regression_loglog
-from src.config import RNG_DEFAULT
+from src.stats_utils import linear_regression_loglog
+from src.config import RNG_DEFAULT, budget
+from src.executor import run_into
 from src.sims.diffusion_localization_mc import run_simulation
 
 RESULTS_DIR = Path("results")
@@ -57,27 +60,23 @@ class Config:
     bootstrap_seed: int = 777
 
 
+def _seed_slope(task, rng) -> float:
+    phi_values, D, sigma_m, n_mc = task
+    delta_t = run_simulation(phi_values, D=D, sigma_m=sigma_m, n_mc=n_mc, rng=rng)
+    slope, _ = linear_regression_loglog(phi_values, delta_t)
+    return float(slope)
+
+
 def main() -> None:
-    cfg = Config()
+    cfg = Config(n_seeds=budget(Config.n_seeds, minimum=3), n_mc=budget(Config.n_mc))
     phi_values = np.array(cfg.phi_values, dtype=float)
 
-    slopes = []
     # Use deterministic seed schedule derived from RNG_DEFAULT.seed
     base_seed = int(getattr(RNG_DEFAULT, "seed", 12345))
 
-    for k in range(cfg.n_seeds):
-        set_seed(base_seed + 10_000 + k)
-
-        delta_t = run_simulation(
-            phi_values,
-            D=float(cfg.D),
-            sigma_m=float(cfg.sigma_m),
-            n_mc=int(cfg.n_mc),
-        )
-        slope, intercept = linear_regression_loglog(phi_values, delta_t)
-        slopes.append(float(slope))
-
-    slopes = np.array(slopes, dtype=float)
+    task = (phi_values, float(cfg.D), float(cfg.sigma_m), int(cfg.n_mc))
+    seeds = [base_seed + 10_000 + k for k in range(cfg.n_seeds)]
+    slopes = run_into(_seed_slope, [task] * cfg.n_seeds, seeds, np.empty(cfg.n_seeds), rng_factory=np.random.RandomState)
 
     slope_mean = float(slopes.mean())
     slope_std = float(slopes.std(ddof=1)) if slopes.size > 1 else 0.0
@@ -0,0 +1,247 @@
+"""
+poisson_stream_mc.py — inhomogeneous Poisson photon streams (continuous monitoring)
+
+Generates detection-event streams from an intensity λ(t; θ) for many
+independent realizations at once, using batched Lewis–Shedler thinning:
+
+    candidates ~ homogeneous Poisson(λ_max) on [0, T],
+    keep t_i with probability λ(t_i; θ) / λ_max.
+
+Events live in a compact ragged store (CSR): `offsets[r]:offsets[r+1]`
+indexes the sorted event times of realization r. The Poisson-process
+score for θ,
+
+    s(θ) = Σ_i ∂_θ log λ(t_i; θ) - ∫_0^T ∂_θ λ(t; θ) dt,
+
+and the empirical Fisher E[s²] are computed directly on the store, with
+no per-event Python loop.
+
+Outputs:
+- results/poisson_stream_mc.json: empirical vs analytic Fisher
+  (`poisson_fisher_adaptive`) for a Gaussian pulse arrival-time model,
+  pooled event rate vs λ(t) and the score histogram (fig12).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.config import RNG_DEFAULT, budget
+from src.io_utils import save_json
+from src.poisson_sampling import poisson_sample
+from src.stats_utils import ScoreAccumulator
+from src.fisher.quadrature import adaptive_quad
+from src.fisher.poisson_fisher import poisson_fisher_adaptive
+
+
+@dataclass(frozen=True)
+class EventStore:
+    """Ragged (CSR) store of event times for many realizations."""
+
+    offsets: np.ndarray
+    times: np.ndarray
+    T: float
+
+    @property
+    def n_realizations(self) -> int:
+        return int(self.offsets.size - 1)
+
+    @property
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def row_ids(self) -> np.ndarray:
+        """Realization index of every event, shape (n_events,)."""
+        return np.repeat(np.arange(self.n_realizations), self.counts)
+
+    def row_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sum per-event values within each realization."""
+        return np.bincount(self.row_ids(), weights=values, minlength=self.n_realizations)
+
+    def row(self, r: int) -> np.ndarray:
+        return self.times[self.offsets[r]:self.offsets[r + 1]]
+
+
+def _per_row(theta, n_real: int) -> np.ndarray:
+    theta = np.asarray(theta, dtype=float)
+    return np.broadcast_to(theta, (n_real,)) if theta.ndim == 0 else theta.reshape(n_real)
+
+
+def simulate_thinning(
+    intensity: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    theta,
+    T: float,
+    n_real: int,
+    lam_max,
+    rng: Optional[np.random.Generator] = None,
+    chunk_events: int = 2**23,
+) -> EventStore:
+    """
+    Batched Lewis–Shedler thinning for n_real realizations.
+
+    Parameters
+    ----------
+    intensity : callable
+        λ(t, θ) evaluated elementwise on equal-shape arrays.
+    theta : float or array_like of shape (n_real,)
+        Parameter per realization.
+    T : float
+        Observation window [0, T].
+    n_real : int
+        Number of independent realizations.
+    lam_max : float or array_like of shape (n_real,)
+        Dominating rate, λ(t; θ) ≤ λ_max on [0, T]; a violation raises.
+    chunk_events : int
+        Target number of candidate events per batch (bounds memory).
+
+    Returns
+    -------
+    EventStore
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    theta = _per_row(theta, n_real)
+    lam_max = _per_row(lam_max, n_real)
+
+    per_row = max(float(np.mean(lam_max)) * T, 1.0)
+    block = max(1, int(chunk_events / per_row))
+
+    counts = np.zeros(n_real, dtype=np.int64)
+    pieces = []
+    for start in range(0, n_real, block):
+        stop = min(n_real, start + block)
+        n_cand = poisson_sample(lam_max[start:stop] * T, rng=rng)
+        rows = np.repeat(np.arange(start, stop), n_cand)
+
+        t = rng.uniform(0.0, T, rows.size)
+        lam = np.asarray(intensity(t, theta[rows]), dtype=float)
+        if np.any(lam > lam_max[rows]):
+            raise ValueError("intensity exceeds lam_max; thinning would be biased")
+        keep = rng.uniform(size=rows.size) * lam_max[rows] < lam
+
+        t, rows = t[keep], rows[keep]
+        order = np.lexsort((t, rows))
+        pieces.append(t[order])
+        counts[start:stop] = np.bincount(rows - start, minlength=stop - start)
+
+    offsets = np.zeros(n_real + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    times = np.concatenate(pieces) if pieces else np.empty(0)
+    return EventStore(offsets=offsets, times=times, T=float(T))
+
+
+def stream_scores(
+    store: EventStore,
+    intensity: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    d_intensity: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    theta,
+    rtol: float = 1e-10,
+) -> np.ndarray:
+    """
+    Poisson-process score s(θ) of every realization in the store.
+
+    Returns
+    -------
+    np.ndarray
+        Scores of shape (n_realizations,).
+    """
+    n_real = store.n_realizations
+    theta_rows = _per_row(theta, n_real)
+    th_ev = theta_rows[store.row_ids()]
+
+    lam = np.clip(np.asarray(intensity(store.times, th_ev), dtype=float), 1e-300, None)
+    event_part = store.row_sum(np.asarray(d_intensity(store.times, th_ev), dtype=float) / lam)
+
+    uniq, inv = np.unique(theta_rows, return_inverse=True)
+    th = uniq[:, None]
+    comp, _ = adaptive_quad(
+        lambda t: d_intensity(t[None, :], th),
+        0.0,
+        store.T,
+        (uniq.size,),
+        rtol=rtol,
+        atol=1e-12,
+        initial_intervals=64,
+    )
+    return event_part - comp[inv]
+
+
+def run_simulation(
+    theta: float,
+    T: float = 1.0,
+    base: float = 100.0,
+    amplitude: float = 1.0e4,
+    width: float = 0.05,
+    n_real: int = 2000,
+    seed: int = RNG_DEFAULT.seed,
+):
+    """
+    Pulse arrival-time model λ(t; θ) = b + A exp(-(t-θ)²/(2w²)).
+
+    Returns
+    -------
+    dict
+        Empirical Fisher (± SE), analytic Fisher and event totals, plus
+        the pooled event rate per time bin against λ(t; θ) and the score
+        histogram (density) for the figure.
+    """
+
+    def intensity(t, th):
+        return base + amplitude * np.exp(-0.5 * ((t - th) / width) ** 2)
+
+    def d_intensity(t, th):
+        return amplitude * np.exp(-0.5 * ((t - th) / width) ** 2) * (t - th) / width**2
+
+    rng = np.random.default_rng(seed)
+    store = simulate_thinning(intensity, theta, T, n_real, lam_max=base + amplitude, rng=rng)
+    scores = stream_scores(store, intensity, d_intensity, theta)
+    acc = ScoreAccumulator(k=1).update(scores)
+
+    I_analytic, I_err = poisson_fisher_adaptive(intensity, d_intensity, theta, T, points=[theta])
+
+    t_edges = np.linspace(0.0, T, 201)
+    rate = np.histogram(store.times, bins=t_edges)[0] / (n_real * np.diff(t_edges))
+    s_counts, s_edges = np.histogram(scores, bins=60, density=True)
+    return {
+        "I_emp": float(acc.fim[0, 0]),
+        "I_emp_se": float(acc.fim_stderr[0, 0]),
+        "score_mean": float(acc.mean[0]),
+        "I_analytic": float(I_analytic),
+        "I_analytic_err": float(I_err),
+        "n_events": int(store.times.size),
+        "rate_t_edges": t_edges.tolist(),
+        "rate_emp": rate.tolist(),
+        "rate_model": intensity(0.5 * (t_edges[1:] + t_edges[:-1]), theta).tolist(),
+        "score_edges": s_edges.tolist(),
+        "score_density": s_counts.tolist(),
+    }
+
+
+def main():
+    theta = 0.4
+    T = 1.0
+    n_real = budget(2000)
+
+    res = run_simulation(theta, T=T, n_real=n_real)
+
+    save_json(
+        "poisson_stream_mc.json",
+        {
+            "model": "lambda(t)=b+A*exp(-(t-theta)^2/(2w^2)), Lewis-Shedler thinning, CSR store",
+            "theta": theta,
+            "T": T,
+            "n_real": n_real,
+            **res,
+        },
+    )
+
+    print(
+        "Poisson stream Fisher: empirical %.4g ± %.2g vs analytic %.4g (%d events)"
+        % (res["I_emp"], res["I_emp_se"], res["I_analytic"], res["n_events"])
+    )
+
+
+if __name__ == "__main__":
+    main()
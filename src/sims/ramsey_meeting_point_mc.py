@@ -19,7 +19,7 @@ import numpy as np
 from src.config import RNG_DEFAULT
 from src.io_utils import save_json
 from src.stats_utils import set_seed
-from src.fisher.ramsey_fisher import ramsey_fisher_max
+from src.meeting_point import meeting_curves, meeting_phase_diagram, solve_meeting_point, trace_meeting_boundary
 
 
 def run_simulation(
@@ -29,19 +29,16 @@ def run_simulation(
 ):
     """
     Compute inference and dynamical scales for each interrogation time.
-    """
-    delta_inf = []
-    delta_dyn = []
 
-    for t in times:
-        # Fisher accumulated over time t
-        I_t = t * ramsey_fisher_max(visibility)
-        delta_inf.append(np.sqrt(2.0 * D_star / I_t))
+    δ_inf = sqrt(2 D* / (t V²)) (accumulated Fisher t·I_max, I_max = V²),
+    δ_dyn = 1/t; evaluated on the whole grid at once.
+    """
+    return meeting_curves(times, visibility=visibility, D_star=D_star)
 
-        # dynamical phase scale ~ 1/t
-        delta_dyn.append(1.0 / t)
 
-    return np.array(delta_inf), np.array(delta_dyn)
+def meeting_boundary(D_star: float = 0.1, gamma: float = 0.2, tol: float = 1e-3):
+    """Meeting-point boundary in the (t, V) plane under dephasing (adaptive tracing)."""
+    return trace_meeting_boundary(("t", 1e-2, 1e2), ("visibility", 0.05, 1.0), D_star=D_star, gamma=gamma, tol=tol)
 
 
 def main():
@@ -51,6 +48,13 @@ def main():
     visibility = 0.8
 
     delta_inf, delta_dyn = run_simulation(times, visibility)
+    meeting = solve_meeting_point(visibility=visibility, D_star=1.0)
+
+    visibilities = np.linspace(0.05, 1.0, 96)
+    D_stars = np.logspace(-1, 1, 81)
+    diagram = meeting_phase_diagram(visibilities, D_stars)
+    boundary_params = {"D_star": 0.1, "gamma": 0.2, "tol": 1e-3}
+    boundary = meeting_boundary(**boundary_params)
 
     save_json(
         "ramsey_meeting_point.json",
@@ -59,6 +63,20 @@ def main():
             "visibility": visibility,
             "delta_inf": delta_inf.tolist(),
             "delta_dyn": delta_dyn.tolist(),
+            "meeting_t": float(meeting.t),
+            "meeting_delta": float(meeting.delta),
+            "phase_diagram": {
+                "visibility": visibilities.tolist(),
+                "D_star": D_stars.tolist(),
+                "t_meet": diagram.t.tolist(),
+            },
+            "boundary": {
+                "axes": list(boundary.axes),
+                **boundary_params,
+                "polylines": [p.tolist() for p in boundary.polylines],
+                "n_evaluations": boundary.n_evaluations,
+                "uniform_grid_evaluations": int((1.0 / boundary_params["tol"] + 1) ** 2),
+            },
         },
     )
 
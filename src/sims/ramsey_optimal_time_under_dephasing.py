@@ -12,13 +12,20 @@ Model:
   Meeting-point condition (DRT):
     δφ_min(t) = sqrt(2 D* / I(t))
   Choose t* that minimizes δφ_min (equivalently maximizes I(t)).
+
+Optimizer:
+  For the default model the stationary point is closed-form,
+    dI/dt = 0  ⇒  t* = 1/Γ  (clipped to the bounds; unimodal in t),
+  and any other Fisher-vs-time model I(t, Γ, r) is maximized with a
+  batched golden-section search in log t. Every solution is checked
+  against a coarse log grid ("ok" / "boundary" / "grid_better").
 """
 
 from __future__ import annotations
 
 import json
-import math
 from pathlib import Path
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 
@@ -26,30 +33,121 @@ RESULTS_DIR = Path("results")
 RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def fisher_ramsey_dephasing(t: float, gamma: float, r: float = 1.0) -> float:
-    """Simple robust Fisher proxy capturing the key trade-off."""
-    if t <= 0.0:
-        return 0.0
-    V = math.exp(-gamma * t)
-    return float(r * (t**2) * (V**2))
-
+FisherModel = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+_INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def fisher_ramsey_dephasing(t, gamma, r=1.0):
+    """Simple robust Fisher proxy capturing the key trade-off (broadcasts)."""
+    t = np.asarray(t, dtype=float)
+    V = np.exp(-np.asarray(gamma, dtype=float) * t)
+    return np.where(t > 0.0, r * (t**2) * (V**2), 0.0)[()]
+
+
+def delta_phi_min(I_T, D_star=1.0):
+    return np.sqrt(2.0 * D_star / (np.asarray(I_T, dtype=float) + 1e-15))[()]
+
+
+def golden_section_max(
+    f: Callable[[np.ndarray], np.ndarray],
+    lo,
+    hi,
+    rtol: float = 1e-12,
+    max_iter: int = 200,
+) -> np.ndarray:
+    """
+    Batched golden-section maximization of f on [lo, hi] (in log t).
+
+    f receives t arrays of the broadcast shape of (lo, hi) and must be
+    unimodal on each bracket.
+    """
+    a = np.log(np.asarray(lo, dtype=float))
+    b = np.log(np.asarray(hi, dtype=float))
+    a, b = np.broadcast_arrays(a, b)
+    a, b = a.copy(), b.copy()
+
+    c = b - _INV_PHI * (b - a)
+    d = a + _INV_PHI * (b - a)
+    fc, fd = f(np.exp(c)), f(np.exp(d))
+    for _ in range(max_iter):
+        if np.all(b - a <= rtol * np.maximum(1.0, np.abs(a))):
+            break
+        left = fc >= fd
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+        c, d = np.where(left, b - _INV_PHI * (b - a), d), np.where(left, c, a + _INV_PHI * (b - a))
+        fc, fd = np.where(left, np.nan, fd), np.where(left, fc, np.nan)
+        f_new = f(np.exp(np.where(left, c, d)))
+        fc = np.where(left, f_new, fc)
+        fd = np.where(left, fd, f_new)
+    return np.exp(0.5 * (a + b))
+
+
+def optimize_t_star_batch(
+    gammas,
+    r=1.0,
+    D_star=1.0,
+    t_bounds: Tuple[float, float] = (1e-4, 10.0),
+    model: Optional[FisherModel] = None,
+    n_check: int = 32,
+) -> dict:
+    """
+    t*(Γ, r, D*) for whole arrays of parameters at once.
+
+    Parameters
+    ----------
+    gammas, r, D_star : array_like
+        Broadcast parameter grids.
+    t_bounds : (float, float)
+        Admissible interrogation times.
+    model : callable, optional
+        I(t, gamma, r); default `fisher_ramsey_dephasing` (closed form used).
+    n_check : int
+        Size of the log grid used for the quality check.
+
+    Returns
+    -------
+    dict of np.ndarray
+        gamma, t_star, I_star, delta_star and a string `quality` array.
+    """
+    gammas, r, D_star = np.broadcast_arrays(
+        np.asarray(gammas, dtype=float), np.asarray(r, dtype=float), np.asarray(D_star, dtype=float)
+    )
+    lo, hi = float(t_bounds[0]), float(t_bounds[1])
+
+    if model is None:
+        model = fisher_ramsey_dephasing
+        with np.errstate(divide="ignore"):
+            t_star = np.clip(np.where(gammas > 0, 1.0 / np.where(gammas > 0, gammas, 1.0), np.inf), lo, hi)
+    else:
+        t_star = golden_section_max(lambda t: model(t, gammas, r), np.full(gammas.shape, lo), np.full(gammas.shape, hi))
+
+    I_star = np.asarray(model(t_star, gammas, r), dtype=float)
+
+    grid = np.geomspace(lo, hi, int(n_check)).reshape((-1,) + (1,) * gammas.ndim)
+    I_grid = np.asarray(model(grid, gammas[None], r[None]), dtype=float).max(axis=0)
+    at_bound = np.isclose(t_star, lo, rtol=1e-6) | np.isclose(t_star, hi, rtol=1e-6)
+    quality = np.where(I_grid > I_star * (1.0 + 1e-9), "grid_better", np.where(at_bound, "boundary", "ok"))
 
-def delta_phi_min(I_T: float, D_star: float = 1.0) -> float:
-    return float(math.sqrt(2.0 * D_star / (I_T + 1e-15)))
+    return {
+        "gamma": gammas,
+        "t_star": t_star,
+        "I_star": I_star,
+        "delta_star": delta_phi_min(I_star, D_star=D_star),
+        "quality": quality,
+    }
 
 
 def optimize_t_star(gamma: float, t_grid: np.ndarray, r: float = 1.0, D_star: float = 1.0) -> dict:
-    I_vals = np.array([fisher_ramsey_dephasing(float(t), gamma, r=r) for t in t_grid], dtype=float)
-    idx = int(np.argmax(I_vals))
-    t_star = float(t_grid[idx])
-    I_star = float(I_vals[idx])
-    d_star = delta_phi_min(I_star, D_star=D_star)
-
+    """Single-Γ row (bounds taken from the ends of t_grid)."""
+    out = optimize_t_star_batch(gamma, r=r, D_star=D_star, t_bounds=(float(t_grid[0]), float(t_grid[-1])))
     return {
         "gamma": float(gamma),
-        "t_star": t_star,
-        "I_star": I_star,
-        "delta_star": d_star,
+        "t_star": float(out["t_star"]),
+        "I_star": float(out["I_star"]),
+        "delta_star": float(out["delta_star"]),
+        "quality": str(out["quality"]),
     }
 
 
@@ -57,18 +155,29 @@ def main() -> None:
     # Parameter sweep (Γ)
     gammas = np.array([0.0, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0], dtype=float)
 
-    # Time grid (wide enough)
-    t_grid = np.linspace(1e-4, 10.0, 2000)
+    # Admissible interrogation times
+    t_bounds = (1e-4, 10.0)
 
     r = 1.0
     D_star = 1.0
 
-    rows = [optimize_t_star(float(g), t_grid, r=r, D_star=D_star) for g in gammas]
+    res = optimize_t_star_batch(gammas, r=r, D_star=D_star, t_bounds=t_bounds)
+    rows = [
+        {
+            "gamma": float(res["gamma"][i]),
+            "t_star": float(res["t_star"][i]),
+            "I_star": float(res["I_star"][i]),
+            "delta_star": float(res["delta_star"][i]),
+            "quality": str(res["quality"][i]),
+        }
+        for i in range(gammas.size)
+    ]
 
     out = {
         "model": "I(t)=r*t^2*exp(-2*gamma*t), meeting-point delta=sqrt(2D*/I)",
         "r": float(r),
         "D_star": float(D_star),
+        "t_bounds": list(t_bounds),
         "rows": rows,
     }
 
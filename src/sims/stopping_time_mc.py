@@ -0,0 +1,206 @@
+"""
+stopping_time_mc.py — distinguishability stopping-time Monte Carlo
+
+The DRT question "how long until two hypotheses become distinguishable"
+is a stopping time: each measurement record accumulates the
+log-likelihood ratio (or information) L_n = Σ_{i≤n} ℓ_i and stops at
+
+    τ = min{ n : L_n ≥ D* }.
+
+Engine:
+- many records ("lanes") advance together, one block of steps at a time;
+- within a block the first crossing is found with a cumulative sum;
+- finished lanes are removed (active-set compaction) and the block length
+  grows as lanes finish, so each block costs ~`target_work` lane-steps and
+  total work tracks the surviving population, not max_steps × n_lanes.
+
+Increment models:
+- Ramsey shots: binary outcomes from `ramsey_probabilities`,
+  ℓ = log p(x | φ1) / p(x | φ0);
+- Poisson photon counts in bins of dt: ℓ = n log(λ1/λ0) - (λ1 - λ0) dt.
+
+For both the Wald approximation E[τ] ≈ D* / KL(p1 || p0) (per step) is
+reported next to the simulated distribution.
+
+Outputs:
+- results/stopping_time_mc.json
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from src.config import RNG_DEFAULT, budget
+from src.io_utils import save_json
+from src.poisson_sampling import poisson_sample
+from src.fisher.ramsey_fisher import ramsey_probabilities
+
+IncrementFn = Callable[[np.random.Generator, np.ndarray, int], np.ndarray]
+
+
+@dataclass(frozen=True)
+class StoppingResult:
+    """Stopping steps per lane (−1 = censored at max_steps) and work done."""
+
+    steps: np.ndarray
+    max_steps: int
+    lane_steps: int
+
+    @property
+    def censored(self) -> np.ndarray:
+        return self.steps < 0
+
+    def quantiles(self, q=(0.1, 0.25, 0.5, 0.75, 0.9)) -> np.ndarray:
+        """Quantiles of τ (censored lanes count as +inf)."""
+        tau = np.where(self.censored, np.inf, self.steps.astype(float))
+        return np.quantile(tau, q)
+
+
+def run_stopping_times(
+    increments: IncrementFn,
+    n_lanes: int,
+    threshold: float,
+    max_steps: int,
+    rng: np.random.Generator,
+    target_work: int = 2**22,
+    max_block: int = 2**16,
+) -> StoppingResult:
+    """
+    Simulate n_lanes records until each crosses `threshold` or max_steps.
+
+    Parameters
+    ----------
+    increments : callable
+        increments(rng, lane_ids, n_steps) -> (len(lane_ids), n_steps).
+    n_lanes : int
+        Number of independent records.
+    threshold : float
+        Crossing level D*.
+    max_steps : int
+        Censoring horizon.
+    target_work : int
+        Lane-steps per block; block length = target_work / active lanes.
+    max_block : int
+        Upper bound on the block length.
+
+    Returns
+    -------
+    StoppingResult
+    """
+    steps = np.full(n_lanes, -1, dtype=np.int64)
+    ids = np.arange(n_lanes)
+    level = np.zeros(n_lanes)
+    done = 0
+    work = 0
+
+    while ids.size and done < max_steps:
+        block = int(min(max_block, max_steps - done, max(1, target_work // ids.size)))
+        path = level[:, None] + np.cumsum(increments(rng, ids, block), axis=1)
+        crossed = path >= threshold
+        hit = crossed.any(axis=1)
+
+        steps[ids[hit]] = done + np.argmax(crossed[hit], axis=1) + 1
+        work += ids.size * block
+        done += block
+
+        keep = ~hit
+        ids = ids[keep]
+        level = path[keep, -1]
+
+    return StoppingResult(steps=steps, max_steps=int(max_steps), lane_steps=int(work))
+
+
+def ramsey_llr_increments(phi0: float, phi1: float, visibility: float = 1.0) -> IncrementFn:
+    """Per-shot LLR of φ1 vs φ0, outcomes drawn under φ1."""
+    p1, _ = ramsey_probabilities(phi1, visibility)
+    p0, _ = ramsey_probabilities(phi0, visibility)
+    up = np.log(p1 / p0)
+    down = np.log((1.0 - p1) / (1.0 - p0))
+
+    def draw(rng, ids, n):
+        return np.where(rng.uniform(size=(ids.size, n)) < p1, up, down)
+
+    return draw
+
+
+def ramsey_kl(phi0: float, phi1: float, visibility: float = 1.0) -> float:
+    """KL(p_φ1 || p_φ0) per shot."""
+    p1, _ = ramsey_probabilities(phi1, visibility)
+    p0, _ = ramsey_probabilities(phi0, visibility)
+    return float(p1 * np.log(p1 / p0) + (1.0 - p1) * np.log((1.0 - p1) / (1.0 - p0)))
+
+
+def poisson_llr_increments(lam0: float, lam1: float, dt: float) -> IncrementFn:
+    """Per-bin LLR of rate λ1 vs λ0, counts drawn under λ1."""
+    log_ratio = np.log(lam1 / lam0)
+    drift = (lam1 - lam0) * dt
+
+    def draw(rng, ids, n):
+        return poisson_sample(lam1 * dt, rng=rng, size=(ids.size, n)) * log_ratio - drift
+
+    return draw
+
+
+def poisson_kl(lam0: float, lam1: float, dt: float) -> float:
+    """KL(Poisson(λ1 dt) || Poisson(λ0 dt)) per bin."""
+    return float(dt * (lam1 * np.log(lam1 / lam0) - lam1 + lam0))
+
+
+def summarize(res: StoppingResult, kl_per_step: float, D_star: float, dt: float = 1.0) -> dict:
+    tau = res.steps[~res.censored].astype(float) * dt
+    q = res.quantiles() * dt
+    return {
+        "mean": float(tau.mean()) if tau.size else float("nan"),
+        "std": float(tau.std(ddof=1)) if tau.size > 1 else float("nan"),
+        "quantiles_10_25_50_75_90": [float(x) for x in q],
+        "censored_fraction": float(res.censored.mean()),
+        "wald_mean": float(D_star / kl_per_step * dt),
+        "lane_steps": res.lane_steps,
+        "lane_steps_worst_case": int(res.steps.size) * int(res.max_steps),
+    }
+
+
+def main():
+    rng = np.random.default_rng(RNG_DEFAULT.seed)
+
+    D_star = 1.0
+    n_lanes = budget(20_000)
+    max_steps = 1_000_000
+
+    phi0 = np.pi / 2
+    visibility = 0.8
+    deltas = [0.05, 0.1, 0.2, 0.4]
+
+    ramsey = {}
+    for d in deltas:
+        res = run_stopping_times(ramsey_llr_increments(phi0, phi0 + d, visibility), n_lanes, D_star, max_steps, rng)
+        ramsey[str(d)] = summarize(res, ramsey_kl(phi0, phi0 + d, visibility), D_star)
+
+    lam0 = 1.0e3
+    dt = 1e-3
+    ratios = [1.05, 1.2, 1.5]
+    photon = {}
+    for r in ratios:
+        res = run_stopping_times(poisson_llr_increments(lam0, lam0 * r, dt), n_lanes, D_star, max_steps, rng)
+        photon[str(r)] = summarize(res, poisson_kl(lam0, lam0 * r, dt), D_star, dt=dt)
+
+    save_json(
+        "stopping_time_mc.json",
+        {
+            "model": "sequential LLR crossing of D*, active-set compaction",
+            "D_star": D_star,
+            "n_lanes": n_lanes,
+            "max_steps": max_steps,
+            "ramsey": {"phi0": phi0, "visibility": visibility, "by_delta": ramsey},
+            "poisson": {"lam0": lam0, "dt": dt, "by_ratio": photon},
+        },
+    )
+
+    print("Stopping-time distributions written: results/stopping_time_mc.json")
+
+
+if __name__ == "__main__":
+    main()
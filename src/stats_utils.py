@@ -2,15 +2,18 @@
 stats_utils.py — statistical helpers used across simulations
 
 Focus:
-- Fisher information estimators
+- Fisher information estimators (batch and streaming / mergeable)
 - simple regression for scaling laws
+- control-variate estimators (mean and quantile)
 - deterministic RNG handling
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Iterable, Tuple
+
 import numpy as np
-from typing import Tuple
 
 
 def set_seed(seed: int) -> None:
@@ -18,24 +21,124 @@ def set_seed(seed: int) -> None:
     np.random.seed(seed)
 
 
-def fisher_from_loglik_grad(grad_loglik: np.ndarray) -> float:
+def fisher_from_loglik_grad(grad_loglik: np.ndarray):
     """
     Estimate Fisher information from gradients of log-likelihood.
 
     Parameters
     ----------
     grad_loglik : np.ndarray
-        Array of shape (N,) containing d/dθ log p(x|θ).
+        Array of shape (N,) containing d/dθ log p(x|θ), or (N, k) for
+        k parameters.
 
     Returns
     -------
-    float
-        Estimated Fisher information.
+    float or np.ndarray
+        Estimated Fisher information (scalar), or the (k, k) FIM.
     """
     grad_loglik = np.asarray(grad_loglik)
+    if grad_loglik.ndim == 2:
+        return grad_loglik.T @ grad_loglik / grad_loglik.shape[0]
     return float(np.mean(grad_loglik ** 2))
 
 
+@dataclass
+class ScoreAccumulator:
+    """
+    Streaming, mergeable estimator of the Fisher information matrix.
+
+    Feed score chunks of shape (chunk, k) with `update`; combine partial
+    accumulators from other workers with `merge`. Running statistics use
+    Welford / Chan pairwise updates, so memory is O(k²) regardless of
+    the number of scores.
+
+    Tracked:
+    - mean and co-moment of the score vector (mean ≈ 0 is a sanity check),
+    - mean and second central moment of every product s_i s_j, giving
+      the FIM estimate E[s s^T] and a standard error per entry.
+    """
+
+    k: int
+    n: int = 0
+    mean: np.ndarray = field(default=None)
+    comoment: np.ndarray = field(default=None)
+    prod_mean: np.ndarray = field(default=None)
+    prod_m2: np.ndarray = field(default=None)
+
+    def __post_init__(self) -> None:
+        k = int(self.k)
+        if self.mean is None:
+            self.mean = np.zeros(k)
+            self.comoment = np.zeros((k, k))
+            self.prod_mean = np.zeros((k, k))
+            self.prod_m2 = np.zeros((k, k))
+
+    def _combine(self, n_b: int, mean_b, com_b, pmean_b, pm2_b) -> None:
+        n_a = self.n
+        n = n_a + n_b
+        if n_b == 0:
+            return
+        w = n_b / n
+        d = mean_b - self.mean
+        dp = pmean_b - self.prod_mean
+
+        self.comoment = self.comoment + com_b + np.outer(d, d) * (n_a * w)
+        self.prod_m2 = self.prod_m2 + pm2_b + dp * dp * (n_a * w)
+        self.mean = self.mean + d * w
+        self.prod_mean = self.prod_mean + dp * w
+        self.n = n
+
+    def update(self, scores: np.ndarray) -> "ScoreAccumulator":
+        """Add a chunk of scores, shape (chunk, k) (or (chunk,) if k = 1)."""
+        s = np.asarray(scores, dtype=float).reshape(-1, self.k)
+        n_b = s.shape[0]
+        if n_b == 0:
+            return self
+
+        mean_b = s.mean(axis=0)
+        c = s - mean_b
+        prods = s[:, :, None] * s[:, None, :]
+        pmean_b = prods.mean(axis=0)
+        dp = prods - pmean_b
+
+        self._combine(n_b, mean_b, c.T @ c, pmean_b, np.einsum("nij,nij->ij", dp, dp))
+        return self
+
+    def merge(self, other: "ScoreAccumulator") -> "ScoreAccumulator":
+        """Merge another accumulator (e.g. from a worker process) into this one."""
+        if other.k != self.k:
+            raise ValueError("cannot merge accumulators with different k")
+        self._combine(other.n, other.mean, other.comoment, other.prod_mean, other.prod_m2)
+        return self
+
+    @property
+    def fim(self) -> np.ndarray:
+        """FIM estimate E[s s^T], shape (k, k)."""
+        return self.prod_mean.copy()
+
+    @property
+    def fim_stderr(self) -> np.ndarray:
+        """Standard error of each FIM entry, shape (k, k)."""
+        if self.n < 2:
+            return np.full((self.k, self.k), np.nan)
+        return np.sqrt(self.prod_m2 / (self.n - 1) / self.n)
+
+    @property
+    def score_covariance(self) -> np.ndarray:
+        """Sample covariance of the score (equals the FIM if E[s] = 0)."""
+        if self.n < 2:
+            return np.full((self.k, self.k), np.nan)
+        return self.comoment / (self.n - 1)
+
+
+def accumulate_scores(chunks: Iterable[np.ndarray], k: int = 1) -> ScoreAccumulator:
+    """Consume an iterable of (chunk, k) score arrays in constant memory."""
+    acc = ScoreAccumulator(k=k)
+    for chunk in chunks:
+        acc.update(chunk)
+    return acc
+
+
 def linear_regression_loglog(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
     """
     Perform linear regression in log-log space:
@@ -56,3 +159,141 @@ def linear_regression_loglog(x: np.ndarray, y: np.ndarray) -> Tuple[float, float
     A = np.vstack([lx, np.ones_like(lx)]).T
     slope, intercept = np.linalg.lstsq(A, ly, rcond=None)[0]
     return float(slope), float(intercept)
+
+
+def log_mean_se(samples: np.ndarray, axis: int = -1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean of log(samples) and its standard error along `axis`.
+
+    exp(mean) is the geometric mean; unlike the sample median it varies
+    smoothly with the model parameters even when the samples are
+    discrete (Poisson counts), so its error bar is always meaningful.
+    """
+    logs = np.log(np.asarray(samples, dtype=float))
+    n = logs.shape[axis]
+    return logs.mean(axis=axis), logs.std(axis=axis, ddof=1) / np.sqrt(n)
+
+
+def weighted_regression_loglog(x: np.ndarray, y: np.ndarray, sigma_log: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Weighted least squares in log-log space, log y = a log x + b, with
+    known standard errors σ of log y (weights 1/σ²).
+
+    Returns
+    -------
+    slope, intercept, slope_se : float
+    """
+    lx = np.log(np.asarray(x, dtype=float))
+    ly = np.log(np.asarray(y, dtype=float))
+    w = 1.0 / np.asarray(sigma_log, dtype=float) ** 2
+
+    A = np.vstack([lx, np.ones_like(lx)]).T
+    cov = np.linalg.inv(A.T @ (w[:, None] * A))
+    slope, intercept = cov @ (A.T @ (w * ly))
+    return float(slope), float(intercept), float(np.sqrt(cov[0, 0]))
+
+
+@dataclass(frozen=True)
+class ControlVariateEstimate:
+    estimate: np.ndarray
+    se: np.ndarray
+    ci_low: np.ndarray
+    ci_high: np.ndarray
+    beta: np.ndarray
+    naive_se: np.ndarray
+    variance_reduction: np.ndarray  # naive_se² / se²
+
+
+def control_variate_estimate(y, c, c_mean, axis: int = -1, level: float = 0.95) -> ControlVariateEstimate:
+    """
+    Control-variate estimate of E[y] from paired samples (y_i, c_i) with known E[c].
+
+    μ̂ = ȳ - β̂ (c̄ - E[c]),  β̂ = Cov(y, c) / Var(c)  (estimated on the same
+    samples). The standard error is that of the regression estimator,
+
+        SE² = s²_res (1/n + (c̄ - E[c])² / Σ (c_i - c̄)²),
+
+    with s²_res the residual variance on n - 2 degrees of freedom, and the
+    CI uses Student t(n - 2); both account for estimating β̂.
+    """
+    from scipy.stats import t as student_t
+
+    y = np.moveaxis(np.asarray(y, dtype=float), axis, -1)
+    c = np.moveaxis(np.asarray(c, dtype=float), axis, -1)
+    n = y.shape[-1]
+    if n < 3:
+        raise ValueError("need at least 3 samples")
+    c_mean = np.asarray(c_mean, dtype=float)
+
+    y_bar, c_bar = y.mean(axis=-1), c.mean(axis=-1)
+    dy, dc = y - y_bar[..., None], c - c_bar[..., None]
+    sxx = np.sum(dc * dc, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where(sxx > 0, np.sum(dy * dc, axis=-1) / np.where(sxx > 0, sxx, 1.0), 0.0)
+        resid = dy - beta[..., None] * dc
+        s2 = np.sum(resid * resid, axis=-1) / (n - 2)
+        shift = c_bar - c_mean
+        se = np.sqrt(s2 * (1.0 / n + np.where(sxx > 0, shift * shift / np.where(sxx > 0, sxx, 1.0), 0.0)))
+        naive_se = y.std(axis=-1, ddof=1) / np.sqrt(n)
+        reduction = naive_se**2 / se**2
+
+    est = y_bar - beta * shift
+    half = student_t.ppf(0.5 + 0.5 * level, n - 2) * se
+    return ControlVariateEstimate(
+        estimate=est[()],
+        se=se[()],
+        ci_low=(est - half)[()],
+        ci_high=(est + half)[()],
+        beta=beta[()],
+        naive_se=naive_se[()],
+        variance_reduction=reduction[()],
+    )
+
+
+def control_variate_quantile(y, indicator, p_indicator, q: float = 0.5, axis: int = -1, level: float = 0.95):
+    """
+    q-quantile of y with a binary control of known mean (e.g. 1{N ≥ m} for a
+    Poisson count N with exact P(N ≥ m)).
+
+    The CDF of y is estimated with the indicator as control variate,
+    F̂(t) = F_n(t) - β(t) (Ī - p), β(t) = Cov(1{y ≤ t}, I) / Var(I), and
+    inverted: the estimate is the smallest sample y with F̂ ≥ q and the CI
+    inverts F̂ at q ∓ z σ_F, σ_F² = q(1 - q)(1 - ρ²) / n (distribution-free,
+    valid for discrete y).
+
+    Returns
+    -------
+    (estimate, ci_low, ci_high, variance_reduction) : tuple of np.ndarray
+        variance_reduction = 1 / (1 - ρ²) at the quantile.
+    """
+    from scipy.stats import norm
+
+    y = np.moveaxis(np.asarray(y, dtype=float), axis, -1)
+    ind = np.moveaxis(np.asarray(indicator, dtype=float), axis, -1)
+    n = y.shape[-1]
+    order = np.argsort(y, axis=-1, kind="stable")
+    ys = np.take_along_axis(y, order, axis=-1)
+    inds = np.take_along_axis(ind, order, axis=-1)
+
+    A = np.arange(1, n + 1) / n
+    i_bar = inds.mean(axis=-1, keepdims=True)
+    var_i = i_bar * (1.0 - i_bar)
+    cov = np.cumsum(inds, axis=-1) / n - A * i_bar
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where(var_i > 0, cov / np.where(var_i > 0, var_i, 1.0), 0.0)
+        F = A - beta * (i_bar - np.asarray(p_indicator, dtype=float)[..., None])
+        rho2 = np.where(var_i > 0, cov**2 / np.where(var_i > 0, A * (1.0 - A) * var_i, 1.0), 0.0)
+    rho2 = np.clip(np.nan_to_num(rho2), 0.0, 1.0)
+    F = np.maximum.accumulate(F, axis=-1)
+
+    def invert(level_q):
+        j = np.sum(F < np.asarray(level_q)[..., None], axis=-1)
+        return np.take_along_axis(ys, np.minimum(j, n - 1)[..., None], axis=-1)[..., 0]
+
+    j_q = np.minimum(np.sum(F < q, axis=-1), n - 1)
+    r2 = np.take_along_axis(rho2, j_q[..., None], axis=-1)[..., 0]
+    sigma = np.sqrt(q * (1.0 - q) * (1.0 - r2) / n)
+    z = norm.ppf(0.5 + 0.5 * level)
+    with np.errstate(divide="ignore"):
+        reduction = 1.0 / (1.0 - r2)
+    return invert(q)[()], invert(q - z * sigma)[()], invert(q + z * sigma)[()], reduction[()]
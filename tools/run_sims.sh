@@ -13,17 +13,9 @@ echo "== Running simulations =="
 
 mkdir -p results
 
-echo "[1] Diffusion localization (Φ^{-1/3})"
-python -m src.sims.diffusion_localization_mc
-
-echo "[2] CTRW / anomalous diffusion scalings"
-python -m src.sims.ctrw_mc
-
-echo "[3] Ramsey meeting-point phase diagram"
-python -m src.sims.ramsey_meeting_point_mc
-
-echo "[4] Mach–Zehnder meeting-point phase diagram"
-python -m src.sims.mzi_meeting_point_mc
+# All registered simulations and sweeps (see src/registry.py; `python -m src --help`)
+python -m src sim "$@"
+python -m src sweep "$@"
 
 echo "== Simulations completed =="
 echo "Results written to results/"